@@ -0,0 +1,30 @@
+"""add foreign key indexes
+
+Revision ID: 3b8e51c7a2d4
+Revises: 1462c3027f99
+Create Date: 2026-10-16 09:10:42.318204+00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3b8e51c7a2d4'
+down_revision = '1462c3027f99'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(op.f('ix_projects_owner_id'), 'projects', ['owner_id'], unique=False)
+    op.create_index(op.f('ix_cleaning_results_project_id'), 'cleaning_results', ['project_id'], unique=False)
+    op.create_index(op.f('ix_cleaning_results_data_file_id'), 'cleaning_results', ['data_file_id'], unique=False)
+    op.create_index(op.f('ix_cleaning_results_check_id'), 'cleaning_results', ['check_id'], unique=False)
+
+
+def downgrade():
+    op.drop_index(op.f('ix_cleaning_results_check_id'), table_name='cleaning_results')
+    op.drop_index(op.f('ix_cleaning_results_data_file_id'), table_name='cleaning_results')
+    op.drop_index(op.f('ix_cleaning_results_project_id'), table_name='cleaning_results')
+    op.drop_index(op.f('ix_projects_owner_id'), table_name='projects')
@@ -0,0 +1,30 @@
+"""generate uuid primary keys in database
+
+Revision ID: 9c4f2d6e8a13
+Revises: 3b8e51c7a2d4
+Create Date: 2026-10-16 11:05:19.604871+00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9c4f2d6e8a13'
+down_revision = '3b8e51c7a2d4'
+branch_labels = None
+depends_on = None
+
+TABLES = ['users', 'projects', 'data_files', 'cleaning_checks', 'cleaning_results']
+
+
+def upgrade():
+    # gen_random_uuid() is built in from Postgres 13; pgcrypto provides it on older servers
+    op.execute('CREATE EXTENSION IF NOT EXISTS pgcrypto')
+    for table in TABLES:
+        op.alter_column(table, 'id', server_default=sa.text('gen_random_uuid()'))
+
+
+def downgrade():
+    for table in TABLES:
+        op.alter_column(table, 'id', server_default=None)
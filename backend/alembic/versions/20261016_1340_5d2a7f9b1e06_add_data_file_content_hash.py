@@ -0,0 +1,28 @@
+"""add data file content hash
+
+Revision ID: 5d2a7f9b1e06
+Revises: 9c4f2d6e8a13
+Create Date: 2026-10-16 13:40:17.604912+00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5d2a7f9b1e06'
+down_revision = '9c4f2d6e8a13'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('data_files', sa.Column('content_hash', sa.String(64), nullable=True))
+    op.add_column('data_files', sa.Column('analysis_cache', sa.JSON(), nullable=True))
+    op.create_index(op.f('ix_data_files_content_hash'), 'data_files', ['content_hash'], unique=False)
+
+
+def downgrade():
+    op.drop_index(op.f('ix_data_files_content_hash'), table_name='data_files')
+    op.drop_column('data_files', 'analysis_cache')
+    op.drop_column('data_files', 'content_hash')
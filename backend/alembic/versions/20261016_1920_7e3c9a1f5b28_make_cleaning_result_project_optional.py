@@ -0,0 +1,24 @@
+"""make cleaning result project optional
+
+Revision ID: 7e3c9a1f5b28
+Revises: 5d2a7f9b1e06
+Create Date: 2026-10-16 19:20:41.318205+00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7e3c9a1f5b28'
+down_revision = '5d2a7f9b1e06'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.alter_column('cleaning_results', 'project_id', existing_type=sa.UUID(), nullable=True)
+
+
+def downgrade():
+    op.alter_column('cleaning_results', 'project_id', existing_type=sa.UUID(), nullable=False)
@@ -1,4 +1,6 @@
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+import os
 import pandas as pd
 import numpy as np
 from sklearn.ensemble import RandomForestClassifier
@@ -8,6 +10,56 @@ import re
 from datetime import datetime, timedelta
 import json
 
+# Text columns are scanned in separate processes once the data has at least
+# this many cells to scan; below it, starting workers costs more than it saves
+PARALLEL_PATTERN_MIN_CELLS = 200_000
+
+def _column_patterns(col: str, values: pd.Series) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Find bot-like patterns in a single text column.
+    
+    Args:
+        col: Name of the column
+        values: The column's values
+        
+    Returns:
+        Identical-response patterns and text patterns found in the column
+    """
+    identical = []
+    value_counts = values.value_counts()
+    identical_responses = value_counts[value_counts > 1]
+    
+    if not identical_responses.empty:
+        identical.append({
+            'type': 'identical_responses',
+            'column': col,
+            'count': len(identical_responses),
+            'examples': identical_responses.head(3).to_dict()
+        })
+    
+    text = []
+    # Check for repetitive patterns
+    repetitive = values.str.count(r'(\b\w+\b)(?:\s+\1\b)+')
+    if repetitive.any():
+        text.append({
+            'type': 'repetitive_text',
+            'column': col,
+            'count': int(repetitive.sum()),
+            'indices': repetitive[repetitive > 0].index.tolist()
+        })
+    
+    # Check for keyboard patterns
+    keyboard_patterns = values.str.count(r'(qwerty|asdfgh|zxcvbn)')
+    if keyboard_patterns.any():
+        text.append({
+            'type': 'keyboard_patterns',
+            'column': col,
+            'count': int(keyboard_patterns.sum()),
+            'indices': keyboard_patterns[keyboard_patterns > 0].index.tolist()
+        })
+    
+    return identical, text
+
 class BotDetector:
     def __init__(self):
         self.model = RandomForestClassifier(n_estimators=100, random_state=42)
@@ -197,18 +249,18 @@ class BotDetector:
         """
         patterns = []
         
+        # Columns are independent, so large inputs are scanned in parallel
+        columns = [(col, df[col]) for col in text_columns]
+        if len(text_columns) > 1 and len(df) * len(text_columns) >= PARALLEL_PATTERN_MIN_CELLS:
+            workers = min(len(text_columns), os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                column_results = list(executor.map(_column_patterns, *zip(*columns)))
+        else:
+            column_results = [_column_patterns(col, values) for col, values in columns]
+        
         # Check for identical responses
-        for col in text_columns:
-            value_counts = df[col].value_counts()
-            identical_responses = value_counts[value_counts > 1]
-            
-            if not identical_responses.empty:
-                patterns.append({
-                    'type': 'identical_responses',
-                    'column': col,
-                    'count': len(identical_responses),
-                    'examples': identical_responses.head(3).to_dict()
-                })
+        for identical, _ in column_results:
+            patterns.extend(identical)
         
         # Check for response time patterns
         if time_column and len(df) > 1:
@@ -232,26 +284,8 @@ class BotDetector:
                 })
         
         # Check for text patterns
-        for col in text_columns:
-            # Check for repetitive patterns
-            repetitive = df[col].str.count(r'(\b\w+\b)(?:\s+\1\b)+')
-            if repetitive.any():
-                patterns.append({
-                    'type': 'repetitive_text',
-                    'column': col,
-                    'count': int(repetitive.sum()),
-                    'indices': repetitive[repetitive > 0].index.tolist()
-                })
-            
-            # Check for keyboard patterns
-            keyboard_patterns = df[col].str.count(r'(qwerty|asdfgh|zxcvbn)')
-            if keyboard_patterns.any():
-                patterns.append({
-                    'type': 'keyboard_patterns',
-                    'column': col,
-                    'count': int(keyboard_patterns.sum()),
-                    'indices': keyboard_patterns[keyboard_patterns > 0].index.tolist()
-                })
+        for _, text in column_results:
+            patterns.extend(text)
         
         return {
             'total_responses': len(df),
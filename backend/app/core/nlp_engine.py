@@ -9,6 +9,16 @@ from collections import defaultdict
 import os
 import httpx
 
+# Texts per forward pass when scoring sentiment
+SENTIMENT_BATCH_SIZE = 64
+
+# Texts per forward pass when classifying; each text is paired with every
+# candidate label, so a batch holds that many premise/hypothesis pairs
+ZERO_SHOT_BATCH_SIZE = 16
+
+# Texts per batch when running spaCy entity extraction
+ENTITY_BATCH_SIZE = 256
+
 class NLEngine:
     def __init__(self):
         self.use_deepseek = os.getenv('USE_DEEPSEEK', 'false').lower() == 'true'
@@ -37,6 +47,9 @@ class NLEngine:
             'date': r'\b\d{1,2}[-/]\d{1,2}[-/]\d{2,4}\b',
             'time': r'\b\d{1,2}:\d{2}\s*(?:AM|PM|am|pm)?\b'
         }
+        # Compiled forms of entity_patterns, keyed by the pattern string so
+        # patterns changed after construction are compiled when first used
+        self._compiled_entity_patterns: Dict[str, re.Pattern] = {}
     
     async def call_deepseek(self, prompt: str) -> Dict[str, Any]:
         """
@@ -81,11 +94,14 @@ class NLEngine:
         if isinstance(texts, str):
             texts = [texts]
         
+        # Score all texts in one pipeline call; the pipeline pads and runs
+        # them through the model in batches instead of one text at a time
+        sentiments = self.sentiment_analyzer(
+            texts, batch_size=SENTIMENT_BATCH_SIZE, truncation=True
+        )
+        
         results = []
-        for text in texts:
-            # Get basic sentiment
-            sentiment = self.sentiment_analyzer(text)[0]
-            
+        for text, sentiment in zip(texts, sentiments):
             # Get detailed analysis if requested
             if detailed:
                 blob = TextBlob(text)
@@ -134,14 +150,18 @@ class NLEngine:
         if isinstance(texts, str):
             texts = [texts]
         
+        # Classify all texts in one pipeline call so they share batches
+        classifications = self.zero_shot_classifier(
+            texts,
+            candidate_labels,
+            multi_label=multi_label,
+            batch_size=ZERO_SHOT_BATCH_SIZE
+        )
+        if isinstance(classifications, dict):
+            classifications = [classifications]
+        
         results = []
-        for text in texts:
-            classification = self.zero_shot_classifier(
-                text,
-                candidate_labels,
-                multi_label=multi_label
-            )
-            
+        for text, classification in zip(texts, classifications):
             results.append({
                 'text': text,
                 'labels': classification['labels'],
@@ -161,13 +181,14 @@ class NLEngine:
         }
     
     def extract_entities(self, texts: Union[str, List[str]],
-                        custom_patterns: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+                        custom_patterns: Optional[Dict[str, Union[str, re.Pattern]]] = None) -> Dict[str, Any]:
         """
         Extract named entities and custom patterns from texts.
         
         Args:
             texts: Single text or list of texts to analyze
-            custom_patterns: Optional dict of custom regex patterns
+            custom_patterns: Optional dict of custom regex patterns, as strings
+                or compiled patterns
             
         Returns:
             Dict containing entity extraction results
@@ -175,13 +196,22 @@ class NLEngine:
         if isinstance(texts, str):
             texts = [texts]
         
-        # Combine default and custom patterns
-        patterns = {**self.entity_patterns, **(custom_patterns or {})}
+        # Combine default and custom patterns, compiling each one once
+        # instead of once per text; compiled patterns are used as given
+        patterns = {
+            entity_type: self._compiled_entity_pattern(pattern)
+            for entity_type, pattern in self.entity_patterns.items()
+        }
+        patterns.update(
+            (entity_type, self._compile_pattern(pattern))
+            for entity_type, pattern in (custom_patterns or {}).items()
+        )
         
         results = []
-        for text in texts:
+        # Stream the texts through spaCy in batches
+        docs = self.nlp.pipe(texts, batch_size=ENTITY_BATCH_SIZE)
+        for text, doc in zip(texts, docs):
             # Get spaCy entities
-            doc = self.nlp(text)
             spacy_entities = {
                 ent.label_: ent.text
                 for ent in doc.ents
@@ -190,7 +220,7 @@ class NLEngine:
             # Get custom pattern matches
             custom_entities = {}
             for entity_type, pattern in patterns.items():
-                matches = re.finditer(pattern, text, re.IGNORECASE)
+                matches = pattern.finditer(text)
                 custom_entities[entity_type] = [m.group() for m in matches]
             
             results.append({
@@ -217,6 +247,22 @@ class NLEngine:
             }
         }
     
+    def _compiled_entity_pattern(self, pattern: Union[str, re.Pattern]) -> re.Pattern:
+        """Compile a default entity pattern, reusing earlier compilations."""
+        if isinstance(pattern, re.Pattern):
+            return pattern
+        compiled = self._compiled_entity_patterns.get(pattern)
+        if compiled is None:
+            compiled = self._compiled_entity_patterns[pattern] = self._compile_pattern(pattern)
+        return compiled
+    
+    @staticmethod
+    def _compile_pattern(pattern: Union[str, re.Pattern]) -> re.Pattern:
+        """Compile a string pattern case-insensitively; pass compiled ones through."""
+        if isinstance(pattern, re.Pattern):
+            return pattern
+        return re.compile(pattern, re.IGNORECASE)
+    
     def analyze_text_quality(self, texts: Union[str, List[str]]) -> Dict[str, Any]:
         """
         Analyze text quality metrics.
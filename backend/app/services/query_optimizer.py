@@ -3,10 +3,24 @@ from sqlalchemy import text
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 import logging
+import hashlib
+import time
+from collections import OrderedDict
 from datetime import datetime
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
+# Analyses kept per optimizer, and how long one is reused before the query
+# is analyzed again; plans and timings go stale as data and indexes change
+ANALYSIS_CACHE_SIZE = 128
+ANALYSIS_CACHE_TTL_SECONDS = 300
+
+@lru_cache(maxsize=1024)
+def _digest(query_str: str) -> str:
+    """Hash a query string; the same queries are analyzed over and over."""
+    return hashlib.md5(query_str.encode()).hexdigest()
+
 class QueryOptimizer:
     """Service for optimizing database queries and managing query performance."""
 
@@ -18,8 +32,13 @@ class QueryOptimizer:
             db_session (Session): SQLAlchemy database session
         """
         self.db = db_session
-        self.query_cache: Dict[str, Dict] = {}
-        self.query_stats: Dict[str, Dict] = {}
+        # Query hash -> (monotonic expiry time, analysis), oldest first
+        self.query_cache: 'OrderedDict[str, tuple]' = OrderedDict()
+        self.query_stats: 'OrderedDict[str, Dict]' = OrderedDict()
+
+    def clear_cache(self) -> None:
+        """Forget cached analyses so the next analysis runs the query again."""
+        self.query_cache.clear()
 
     def analyze_query(self, query: str, params: Optional[Dict] = None) -> Dict:
         """
@@ -32,6 +51,16 @@ class QueryOptimizer:
         Returns:
             Dict: Query analysis results including execution plan and statistics
         """
+        # Reuse a recent analysis of the same query and parameters instead
+        # of running EXPLAIN ANALYZE again
+        query_hash = self._hash_query(query, params)
+        cached = self.query_cache.get(query_hash)
+        if cached is not None:
+            expires_at, analysis = cached
+            if time.monotonic() < expires_at:
+                return analysis
+            del self.query_cache[query_hash]
+
         try:
             # Get query execution plan
             explain_query = f"EXPLAIN ANALYZE {query}"
@@ -45,12 +74,18 @@ class QueryOptimizer:
                 'execution_plan': plan,
                 'statistics': stats,
                 'timestamp': datetime.utcnow().isoformat(),
-                'query_hash': self._hash_query(query, params)
+                'query_hash': query_hash
             }
 
-            # Cache the analysis
-            self.query_cache[analysis['query_hash']] = analysis
-            self.query_stats[analysis['query_hash']] = stats
+            # Cache the analysis, dropping the oldest beyond the size limit
+            self.query_cache[query_hash] = (
+                time.monotonic() + ANALYSIS_CACHE_TTL_SECONDS, analysis
+            )
+            self.query_stats[query_hash] = stats
+            self.query_stats.move_to_end(query_hash)
+            for cache in (self.query_cache, self.query_stats):
+                while len(cache) > ANALYSIS_CACHE_SIZE:
+                    cache.popitem(last=False)
 
             return analysis
 
@@ -79,6 +114,10 @@ class QueryOptimizer:
             # Generate optimized query
             optimized_query = self._apply_optimizations(query, suggestions)
             
+            # Applying suggestions may change how queries run, so earlier
+            # analyses no longer describe them
+            self.clear_cache()
+            
             # Analyze optimized query
             optimized_analysis = self.analyze_query(optimized_query, params)
             
@@ -111,9 +150,8 @@ class QueryOptimizer:
 
     def _hash_query(self, query: str, params: Optional[Dict] = None) -> str:
         """Generate a unique hash for a query and its parameters."""
-        import hashlib
         query_str = f"{query}{str(params or {})}"
-        return hashlib.md5(query_str.encode()).hexdigest()
+        return _digest(query_str)
 
     def _get_query_stats(self, query: str) -> Dict:
         """Get query execution statistics."""
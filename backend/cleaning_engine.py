@@ -1,4 +1,4 @@
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Iterable
 import pandas as pd
 import numpy as np
 from datetime import datetime
@@ -23,6 +23,15 @@ class CheckSeverity(Enum):
     HIGH = "high"
     CRITICAL = "critical"
 
+# Leaf types that never contain a CheckSeverity
+_PLAIN_TYPES = frozenset((str, int, float, bool, type(None), np.int64, np.float64, np.bool_))
+
+# Fields that identify what an issue is about when merging chunk results
+_ISSUE_KEY_FIELDS = ('column', 'field', 'rule', 'section', 'issue_type')
+
+# Summary values that count rows rather than issues, summed across chunks
+_SUMMED_SUMMARY_KEYS = frozenset(('total_duplicates', 'total_speeders', 'unusual_response_times'))
+
 @dataclass
 class CheckResult:
     """Structured result for a cleaning check."""
@@ -177,6 +186,18 @@ class CleaningEngine:
         }
 
     def _convert_enum_to_value(self, obj):
+        # Dispatch on the exact type first: result payloads are mostly plain
+        # scalars, which are returned without any isinstance checks
+        obj_type = type(obj)
+        if obj_type in _PLAIN_TYPES:
+            return obj
+        if obj_type is dict:
+            return {k: self._convert_enum_to_value(v) for k, v in obj.items()}
+        if obj_type is list:
+            return [self._convert_enum_to_value(i) for i in obj]
+        if obj_type is CheckSeverity:
+            return obj.value
+        # Subclasses (e.g. defaultdict) take the general path
         if isinstance(obj, dict):
             return {k: self._convert_enum_to_value(v) for k, v in obj.items()}
         elif isinstance(obj, list):
@@ -198,6 +219,7 @@ class CleaningEngine:
         """
         start_time = datetime.now()
         results = {}
+        check_times = {}
         
         # Use ThreadPoolExecutor for parallel processing of checks
         with ThreadPoolExecutor(max_workers=4) as executor:
@@ -210,6 +232,7 @@ class CleaningEngine:
                 check_name = future_to_check[future]
                 try:
                     check_result = future.result()
+                    check_times[check_name] = check_result.execution_time
                     # Convert CheckResult dataclass to dict
                     results[check_name] = asdict(check_result)
                 except Exception as e:
@@ -221,10 +244,138 @@ class CleaningEngine:
                         'severity': CheckSeverity.CRITICAL.value
                     }
         
-        self.total_execution_time = (datetime.now() - start_time).total_seconds()
+        total_execution_time = (datetime.now() - start_time).total_seconds()
+        # Timings are collected per call so concurrent calls on a shared
+        # engine don't mix; the attributes only expose the latest run
+        self.check_times = check_times
+        self.total_execution_time = total_execution_time
         # Recursively convert all CheckSeverity enums to their string value
         results = self._convert_enum_to_value(results)
-        return self._generate_summary_report(results)
+        return self._generate_summary_report(results, total_execution_time, check_times)
+
+    def process_chunks(self, chunks: Iterable[pd.DataFrame]) -> Dict[str, Any]:
+        """
+        Process a dataset that arrives in chunks through all cleaning checks.
+
+        Each chunk is checked on its own and the partial results are folded
+        together, so only one chunk has to be held in memory at a time.
+        Checks that depend on statistics over the whole dataset (outliers,
+        duplicates, distributions) are therefore evaluated per chunk.
+
+        Args:
+            chunks (Iterable[pd.DataFrame]): Consecutive chunks of the dataset
+
+        Returns:
+            Dict[str, Any]: Results of all cleaning checks, in the same shape
+                as process_data
+        """
+        start_time = datetime.now()
+        chunk_results = {}
+        check_times = {}
+        total_rows = 0
+        
+        for chunk in chunks:
+            total_rows += len(chunk)
+            report = self.process_data(chunk)
+            for check_name, result in report['detailed_results'].items():
+                chunk_results.setdefault(check_name, []).append(result)
+            for check_name, execution_time in report['summary']['check_performance'].items():
+                check_times[check_name] = check_times.get(check_name, 0) + execution_time
+        
+        merged = {
+            check_name: self._merge_check_results(results, total_rows)
+            for check_name, results in chunk_results.items()
+        }
+        total_execution_time = (datetime.now() - start_time).total_seconds()
+        self.check_times = check_times
+        self.total_execution_time = total_execution_time
+        return self._generate_summary_report(merged, total_execution_time, check_times)
+
+    def _merge_check_results(self, results: List[Dict[str, Any]], total_rows: int) -> Dict[str, Any]:
+        """
+        Combine the results of a check on consecutive chunks into one result.
+
+        Issues about the same column, field, rule or section and issue type
+        are merged into a single issue: counts are summed, row indices are
+        concatenated and percentages are recomputed against the total number
+        of rows. Summary values that count issues are recounted on the merged
+        issues, so a column flagged in several chunks is counted once.
+
+        Args:
+            results (List[Dict[str, Any]]): Results of the check on each chunk
+            total_rows (int): Number of rows over all chunks
+
+        Returns:
+            Dict[str, Any]: Combined result
+        """
+        failed = [result for result in results if result.get('status') == 'failed']
+        if failed:
+            return failed[0]
+        
+        merged_issues = {}
+        for result in results:
+            for issue in result.get('details', {}).get('issues', []):
+                # Per-row issues are distinct; everything else is keyed on
+                # what it is about
+                if 'row_index' in issue:
+                    key = (len(merged_issues),)
+                else:
+                    key = tuple(issue.get(field) for field in _ISSUE_KEY_FIELDS)
+                if key in merged_issues:
+                    merged_issues[key] = self._merge_issue(merged_issues[key], issue)
+                else:
+                    merged_issues[key] = dict(issue)
+        issues = list(merged_issues.values())
+        
+        for issue in issues:
+            if 'missing_percentage' in issue:
+                issue['missing_percentage'] = float(issue['missing_count'] / total_rows * 100)
+            if 'completeness_percentage' in issue:
+                issue['completeness_percentage'] = float(
+                    (total_rows - issue['missing_count']) / total_rows * 100
+                )
+        
+        summary = {}
+        for result in results:
+            for key, value in result.get('details', {}).get('summary', {}).items():
+                if key.startswith('max_'):
+                    field = key[len('max_'):]
+                    values = [issue[field] for issue in issues if field in issue]
+                    summary[key] = float(max(values)) if values else max(summary.get(key, value), value)
+                elif key in _SUMMED_SUMMARY_KEYS:
+                    summary[key] = summary.get(key, 0) + value
+                else:
+                    summary[key] = len(issues)
+        
+        return {
+            **results[0],
+            'issues_found': len(issues),
+            'details': {**results[0].get('details', {}), 'issues': issues, 'summary': summary},
+            'execution_time': sum(result.get('execution_time', 0) for result in results)
+        }
+
+    @staticmethod
+    def _merge_issue(merged: Dict[str, Any], issue: Dict[str, Any]) -> Dict[str, Any]:
+        """Fold one chunk's issue into the same issue found in earlier chunks."""
+        merged = dict(merged)
+        for key, value in issue.items():
+            if key not in merged:
+                merged[key] = value
+            elif key == 'indices' or key.endswith('_indices'):
+                merged[key] = merged[key] + value
+            elif key == 'count' or key.endswith('_count') or key == 'pattern_length':
+                merged[key] += value
+            elif key == 'min_value':
+                merged[key] = min(merged[key], value)
+            elif key in ('max_value', 'range_days'):
+                merged[key] = max(merged[key], value)
+            elif key == 'low_freq_categories':
+                categories = dict(merged[key])
+                for category, count in value.items():
+                    categories[category] = categories.get(category, 0) + count
+                merged[key] = categories
+            # Other statistics (means, thresholds) keep the first chunk's value
+        return merged
 
     def _run_check(self, check_name: str, check_info: Dict[str, Any], data: pd.DataFrame) -> CheckResult:
         """
@@ -242,7 +393,6 @@ class CleaningEngine:
         try:
             check_result = check_info['function'](data)
             execution_time = (datetime.now() - start_time).total_seconds()
-            self.check_times[check_name] = execution_time
             
             return CheckResult(
                 check_name=check_name,
@@ -256,12 +406,19 @@ class CleaningEngine:
             logger.error(f"Error in check {check_name}: {str(e)}")
             raise
 
-    def _generate_summary_report(self, results: Dict[str, Any]) -> Dict[str, Any]:
+    def _generate_summary_report(
+        self,
+        results: Dict[str, Any],
+        execution_time: float,
+        check_times: Dict[str, float]
+    ) -> Dict[str, Any]:
         """
         Generate a comprehensive summary report of all checks.
 
         Args:
             results (Dict[str, Any]): Results from all checks
+            execution_time (float): Total execution time of the run in seconds
+            check_times (Dict[str, float]): Execution time of each check in seconds
 
         Returns:
             Dict[str, Any]: Summary report
@@ -281,8 +438,8 @@ class CleaningEngine:
                 'total_issues_found': total_issues,
                 'failed_checks': failed_checks,
                 'severity_distribution': severity_counts,
-                'execution_time': self.total_execution_time,
-                'check_performance': self.check_times
+                'execution_time': execution_time,
+                'check_performance': check_times
             },
             'detailed_results': results
         }
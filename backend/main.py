@@ -1,16 +1,18 @@
-from fastapi import FastAPI, Depends
+import os
+
+from fastapi import FastAPI, Depends, Response
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy.orm import Session
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.inmemory import InMemoryBackend
+from fastapi_cache.decorator import cache
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
 
-from backend.database.base import get_db, engine, Base
+from backend.database.base import get_async_db, engine, Base
 from backend.routers import users, auth, projects, files
 from backend.routes import cleaning
 from backend.routes import analysis
 
-# Create database tables
-Base.metadata.create_all(bind=engine)
-
 app = FastAPI(
     title="Survey Data Cleaning API",
     description="API for cleaning and validating survey data files",
@@ -26,38 +28,67 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Include routers
-app.include_router(auth.router, prefix="/auth", tags=["Authentication"])
-app.include_router(users.router, prefix="/users", tags=["Users"])
-app.include_router(projects.router, prefix="/projects", tags=["Projects"])
+# Include routers; each router declares its own path prefix
+app.include_router(auth.router, tags=["Authentication"])
+app.include_router(users.router, tags=["Users"])
+app.include_router(projects.router, tags=["Projects"])
 app.include_router(files.router)
-app.include_router(cleaning.router, prefix="/cleaning", tags=["Cleaning"])
+app.include_router(cleaning.router, tags=["Cleaning"])
 app.include_router(analysis.router)
 
+# The root payload never changes, so it is serialized once at import
+ROOT_RESPONSE_BODY = b'{"status":"ok","message":"Survey Data Cleaning API is running"}'
+
+@app.on_event("startup")
+def create_tables():
+    """
+    Create missing tables for local development.
+
+    Deployments apply the schema with ``alembic upgrade head`` instead, so
+    workers start without a schema round-trip unless CREATE_TABLES_ON_STARTUP=1.
+    """
+    if os.getenv("CREATE_TABLES_ON_STARTUP") == "1":
+        Base.metadata.create_all(bind=engine)
+
+@app.on_event("startup")
+async def init_cache():
+    """Initialize the in-memory response cache."""
+    FastAPICache.init(InMemoryBackend(), prefix="hc")
+
+def health_key_builder(func, namespace: str = "", **kwargs) -> str:
+    """
+    Build the cache key for the health check.
+
+    The database session is deliberately left out of the key, so every probe
+    within the expiry window shares one cached result.
+    """
+    return f"{namespace}:{func.__module__}:{func.__name__}"
+
 @app.get("/")
 async def root():
     """
     Root endpoint to verify API is running.
     
     Returns:
-        dict: Status message
+        Response: Pre-serialized status message
     """
-    return {"status": "ok", "message": "Survey Data Cleaning API is running"}
+    return Response(content=ROOT_RESPONSE_BODY, media_type="application/json")
 
 @app.get("/health")
-async def health_check(db: Session = Depends(get_db)):
+@cache(expire=2, key_builder=health_key_builder)
+async def health_check(db: AsyncSession = Depends(get_async_db)):
     """
     Health check endpoint to verify database connection.
     
     Args:
-        db (Session): Database session
+        db (AsyncSession): Database session
         
     Returns:
         dict: Health status
     """
     try:
         # Try to execute a simple query
-        db.execute(text("SELECT 1"))
+        await db.execute(text("SELECT 1"))
         return {
             "status": "healthy",
             "database": "connected"
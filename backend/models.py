@@ -1,15 +1,14 @@
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Integer, JSON, Float, Text
+from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Integer, JSON, Float, Text, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
-import uuid
 
 from backend.database.base import Base
 
 class User(Base):
     __tablename__ = 'users'
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text('gen_random_uuid()'))
     email = Column(String(255), unique=True, nullable=False)
     name = Column(String(255), nullable=False)
     role = Column(String(50), nullable=False, default='analyst')
@@ -22,10 +21,10 @@ class User(Base):
 class Project(Base):
     __tablename__ = 'projects'
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text('gen_random_uuid()'))
     name = Column(String(255), nullable=False)
     description = Column(Text)
-    owner_id = Column(UUID(as_uuid=True), ForeignKey('users.id'), nullable=False)
+    owner_id = Column(UUID(as_uuid=True), ForeignKey('users.id'), nullable=False, index=True)
     status = Column(String(50), default='draft')
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -36,11 +35,13 @@ class Project(Base):
 class DataFile(Base):
     __tablename__ = 'data_files'
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text('gen_random_uuid()'))
     original_filename = Column(String(255), nullable=False)
     file_size = Column(Integer)
     file_type = Column(String(50))
     upload_status = Column(String(50), default='pending')
+    content_hash = Column(String(64), index=True)
+    analysis_cache = Column(JSON)
     created_at = Column(DateTime, default=datetime.utcnow)
     
     cleaning_results = relationship("CleaningResult", back_populates="data_file")
@@ -48,7 +49,7 @@ class DataFile(Base):
 class CleaningCheck(Base):
     __tablename__ = 'cleaning_checks'
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text('gen_random_uuid()'))
     name = Column(String(255), nullable=False)
     description = Column(Text)
     category = Column(String(100))
@@ -59,10 +60,11 @@ class CleaningCheck(Base):
 class CleaningResult(Base):
     __tablename__ = 'cleaning_results'
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    project_id = Column(UUID(as_uuid=True), ForeignKey('projects.id'), nullable=False)
-    data_file_id = Column(UUID(as_uuid=True), ForeignKey('data_files.id'), nullable=False)
-    check_id = Column(UUID(as_uuid=True), ForeignKey('cleaning_checks.id'), nullable=False)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text('gen_random_uuid()'))
+    # Data files are not tied to a project, so results cleaned from one have none
+    project_id = Column(UUID(as_uuid=True), ForeignKey('projects.id'), nullable=True, index=True)
+    data_file_id = Column(UUID(as_uuid=True), ForeignKey('data_files.id'), nullable=False, index=True)
+    check_id = Column(UUID(as_uuid=True), ForeignKey('cleaning_checks.id'), nullable=False, index=True)
     status = Column(String(50), default='pending')
     issues_found = Column(Integer, default=0)
     details = Column(JSON)
@@ -1,13 +1,17 @@
-from datetime import timedelta
-from fastapi import APIRouter, Depends, HTTPException, status
+from datetime import datetime, timedelta
+from uuid import UUID
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from backend.database.base import get_db
+from backend.database.base import AsyncSessionLocal, get_async_db
 from backend.models import User
 from backend.schemas import Token
 from backend.security import (
     verify_password,
+    get_password_hash,
     create_access_token,
     ACCESS_TOKEN_EXPIRE_MINUTES
 )
@@ -18,17 +22,37 @@ router = APIRouter(
     responses={401: {"description": "Unauthorized"}},
 )
 
+async def _update_last_login(user_id: UUID) -> None:
+    """
+    Record a user's last login time.
+
+    Runs as a background task after the token response has been sent, so it
+    opens its own short-lived session instead of reusing the request's.
+
+    Args:
+        user_id (UUID): ID of the user who logged in
+    """
+    async with AsyncSessionLocal() as db:
+        await db.execute(
+            update(User)
+            .where(User.id == user_id)
+            .values(last_login=datetime.utcnow())
+        )
+        await db.commit()
+
 @router.post("/token", response_model=Token)
 async def login_for_access_token(
+    background_tasks: BackgroundTasks,
     form_data: OAuth2PasswordRequestForm = Depends(),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get access token for user.
     
     Args:
+        background_tasks (BackgroundTasks): Tasks run after the response is sent
         form_data (OAuth2PasswordRequestForm): Login form data
-        db (Session): Database session
+        db (AsyncSession): Database session
         
     Returns:
         Token: Access token
@@ -36,8 +60,9 @@ async def login_for_access_token(
     Raises:
         HTTPException: If authentication fails
     """
-    user = db.query(User).filter(User.email == form_data.username).first()
-    if not user or not verify_password(form_data.password, user.password):
+    result = await db.execute(select(User).where(User.email == form_data.username))
+    user = result.scalars().first()
+    if not user or not await verify_password(form_data.password, user.password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -46,13 +71,12 @@ async def login_for_access_token(
     
     access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
-        data={"sub": user.email},
+        data={"sub": str(user.id), "email": user.email},
         expires_delta=access_token_expires
     )
     
-    # Update last login
-    user.last_login = datetime.utcnow()
-    db.commit()
+    # Update last login off the response path
+    background_tasks.add_task(_update_last_login, user.id)
     
     return {"access_token": access_token, "token_type": "bearer"}
 
@@ -61,7 +85,7 @@ async def register_user(
     email: str,
     password: str,
     name: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Register a new user.
@@ -70,7 +94,7 @@ async def register_user(
         email (str): User email
         password (str): User password
         name (str): User name
-        db (Session): Database session
+        db (AsyncSession): Database session
         
     Returns:
         Token: Access token
@@ -79,14 +103,16 @@ async def register_user(
         HTTPException: If registration fails
     """
     # Check if user already exists
-    if db.query(User).filter(User.email == email).first():
+    result = await db.execute(select(User).where(User.email == email))
+    if result.scalars().first():
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered"
         )
     
     # Create new user
-    hashed_password = get_password_hash(password)
+    # bcrypt is deliberately slow; keep it off the event loop
+    hashed_password = await run_in_threadpool(get_password_hash, password)
     user = User(
         email=email,
         name=name,
@@ -94,13 +120,12 @@ async def register_user(
         role="analyst"  # Default role
     )
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    await db.commit()
     
     # Create access token
     access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
-        data={"sub": user.email},
+        data={"sub": str(user.id), "email": user.email},
         expires_delta=access_token_expires
     )
     
@@ -1,23 +1,29 @@
+import hashlib
 import os
 import shutil
+import sys
 from fastapi import APIRouter, UploadFile, File, HTTPException, status, Depends, Form
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
+from starlette.concurrency import run_in_threadpool
 from tempfile import NamedTemporaryFile
-from typing import Any
-from pandas import read_csv
-import openpyxl
-import numpy as np
+from typing import Any, Dict, Optional, Tuple
+import pandas as pd
 import logging
+import orjson
 import traceback
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from uuid import UUID
-import math
 
 from backend.security import get_current_active_user
 from backend.models import User, DataFile, Project
 from backend.services.spss_processor import SPSSProcessor
+from backend.services.file_loader import (
+    read_csv_file, read_sav_file, read_excel_file, iter_df_chunks, upload_path,
+    write_arrow_copy, UPLOADS_DIR, CHUNKED_PROCESSING_MIN_BYTES
+)
 from backend.cleaning_engine import CleaningEngine
-from backend.database.base import get_db
+from backend.database.base import get_db, session_scope
 from sqlalchemy.exc import NoResultFound
 
 router = APIRouter(
@@ -26,24 +32,180 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
-def to_serializable(obj):
-    if isinstance(obj, float):
-        if math.isnan(obj) or math.isinf(obj):
-            return None
-        return obj
-    if isinstance(obj, np.integer):
-        return int(obj)
-    if isinstance(obj, np.floating):
-        if np.isnan(obj) or np.isinf(obj):
-            return None
-        return float(obj)
-    if isinstance(obj, np.ndarray):
-        return obj.tolist()
-    if isinstance(obj, dict):
-        return {k: to_serializable(v) for k, v in obj.items()}
-    if isinstance(obj, list):
-        return [to_serializable(i) for i in obj]
-    return obj
+# Shared engine: process_data keeps no per-call state on the instance
+_CLEANING_ENGINE = CleaningEngine()
+# Check documentation is static, so it is built once
+_CHECK_DOCS = _CLEANING_ENGINE.get_check_documentation()
+
+# Buffer used when an upload has to be copied through userspace
+UPLOAD_COPY_BUFFER_SIZE = 4 * 1024 * 1024
+
+def _orjson_default(obj: Any) -> Any:
+    """
+    Serialize the pandas values orjson does not handle natively.
+
+    orjson already writes numpy scalars and arrays (OPT_SERIALIZE_NUMPY) and
+    turns NaN/Inf into null; this covers timestamps and missing-value markers
+    that come out of DataFrame.to_dict.
+    """
+    if isinstance(obj, pd.Timestamp):
+        return obj.isoformat()
+    if obj is pd.NaT or obj is pd.NA:
+        return None
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+def _dumps(content: Any) -> bytes:
+    return orjson.dumps(
+        content,
+        default=_orjson_default,
+        option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    )
+
+class DataJSONResponse(ORJSONResponse):
+    """
+    orjson-backed JSON response for payloads built from DataFrames.
+    """
+    def render(self, content: Any) -> bytes:
+        return _dumps(content)
+
+def copy_upload(upload: UploadFile, dest) -> None:
+    """
+    Copy the contents of an uploaded file into an open destination file.
+
+    Starlette spools uploads to a temporary file once they outgrow memory.
+    On Linux those are copied with os.sendfile, kernel to kernel, without
+    passing the bytes through userspace buffers; smaller in-memory uploads
+    fall back to shutil.copyfileobj with a 4 MB buffer.
+
+    Args:
+        upload (UploadFile): The uploaded file, positioned at its start.
+        dest: Binary file object opened for writing.
+    """
+    src = upload.file
+    if sys.platform == 'linux' and getattr(src, '_rolled', False):
+        dest.flush()
+        in_fd, out_fd = src.fileno(), dest.fileno()
+        offset = src.tell()
+        remaining = os.fstat(in_fd).st_size - offset
+        while remaining > 0:
+            sent = os.sendfile(out_fd, in_fd, offset, remaining)
+            if sent == 0:
+                break
+            offset += sent
+            remaining -= sent
+        return
+    shutil.copyfileobj(src, dest, UPLOAD_COPY_BUFFER_SIZE)
+
+def save_upload(upload: UploadFile) -> Tuple[str, str, int]:
+    """
+    Store an uploaded file under its content hash.
+
+    The upload is copied to a temporary file in the uploads directory with
+    copy_upload, so spooled uploads keep their kernel-side copy. The stored
+    file is then hashed with BLAKE2b, reading it back from the page cache,
+    and renamed to its content-addressed path. Uploading the same bytes
+    again ends up at the same path.
+
+    Args:
+        upload (UploadFile): The uploaded file, positioned at its start.
+
+    Returns:
+        tuple: Path of the stored file, hex digest of its contents and its
+            size in bytes.
+    """
+    os.makedirs(UPLOADS_DIR, exist_ok=True)
+    with NamedTemporaryFile(dir=UPLOADS_DIR, delete=False) as tmp:
+        copy_upload(upload, tmp)
+    with open(tmp.name, 'rb') as stored:
+        digest = hashlib.file_digest(stored, lambda: hashlib.blake2b(digest_size=32))
+        file_size = os.fstat(stored.fileno()).st_size
+    content_hash = digest.hexdigest()
+    file_path = upload_path(upload.filename, content_hash)
+    os.replace(tmp.name, file_path)
+    return file_path, content_hash, file_size
+
+def find_analyzed_upload(content_hash: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+    """
+    Look up an earlier upload with the same contents that was analyzed.
+
+    Args:
+        content_hash (str): Hex digest of the uploaded file.
+
+    Returns:
+        tuple or None: ID of the existing DataFile row and its cached
+            structure and cleaning results, or None if there is none.
+    """
+    with session_scope() as db:
+        row = db.execute(
+            select(DataFile.id, DataFile.analysis_cache)
+            .where(DataFile.content_hash == content_hash, DataFile.analysis_cache.isnot(None))
+            .limit(1)
+        ).first()
+    if row is None:
+        return None
+    return str(row.id), row.analysis_cache
+
+def clean_in_chunks(file_path: str, file_type: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Build the structure summary and cleaning results of a large file
+    without loading it into memory at once.
+
+    Args:
+        file_path (str): Path to the CSV or SPSS file.
+        file_type (str): Either 'csv' or 'sav'.
+
+    Returns:
+        tuple: Structure summary (columns, row count, preview) and cleaning results.
+    """
+    structure = {"columns": [], "row_count": 0, "preview": []}
+
+    def chunks():
+        for chunk in iter_df_chunks(file_path, file_type):
+            if not structure["columns"]:
+                structure["columns"] = [str(col) for col in chunk.columns]
+                structure["preview"] = chunk.head(5).to_dict(orient="records")
+            structure["row_count"] += len(chunk)
+            yield chunk
+
+    cleaning_results = _CLEANING_ENGINE.process_chunks(chunks())
+    return structure, cleaning_results
+
+def register_data_file(
+    filename: str,
+    file_size: int,
+    file_type: str,
+    content_hash: Optional[str] = None,
+    analysis_cache: Optional[Dict[str, Any]] = None
+) -> str:
+    """
+    Register an uploaded file in the DataFile table.
+
+    Uses its own short session so no connection is held while the file
+    is parsed.
+
+    Args:
+        filename (str): Original name of the uploaded file.
+        file_size (int): Size of the stored file in bytes.
+        file_type (str): One of 'sav', 'csv' or 'excel'.
+        content_hash (str, optional): Hex digest of the file contents.
+        analysis_cache (dict, optional): Structure and cleaning results to
+            return for later uploads of the same contents.
+
+    Returns:
+        str: ID of the new DataFile row.
+    """
+    with session_scope() as db:
+        data_file = DataFile(
+            original_filename=filename,
+            file_size=file_size,
+            file_type=file_type,
+            upload_status='completed',
+            content_hash=content_hash,
+            analysis_cache=analysis_cache
+        )
+        db.add(data_file)
+        db.flush()
+        return str(data_file.id)
 
 @router.post("/analyze-spss", summary="Upload and analyze SPSS file")
 async def analyze_spss_file(
@@ -63,15 +225,11 @@ async def analyze_spss_file(
 
     try:
         with NamedTemporaryFile(delete=False, suffix=".sav") as tmp:
-            shutil.copyfileobj(file.file, tmp)
+            await run_in_threadpool(copy_upload, file, tmp)
             tmp_path = tmp.name
         processor = SPSSProcessor()
-        structure = processor.load_file(tmp_path)
-        # Load data as DataFrame for cleaning
-        import pyreadstat
-        df, meta = pyreadstat.read_sav(tmp_path)
-        cleaning_engine = CleaningEngine()
-        cleaning_results = cleaning_engine.process_data(df)
+        structure, df = await run_in_threadpool(processor.load_file, tmp_path)
+        cleaning_results = await run_in_threadpool(_CLEANING_ENGINE.process_data, df)
     except Exception as e:
         logging.error(f"Failed to process SPSS file: {str(e)}")
         logging.error(traceback.format_exc())
@@ -81,7 +239,7 @@ async def analyze_spss_file(
             os.remove(tmp_path)
         except Exception:
             pass
-    return JSONResponse(content=to_serializable({"structure": structure, "cleaning_results": cleaning_results}))
+    return DataJSONResponse({"structure": structure, "cleaning_results": cleaning_results})
 
 @router.post("/analyze-csv", summary="Upload and analyze CSV file")
 async def analyze_csv_file(
@@ -94,16 +252,18 @@ async def analyze_csv_file(
         raise HTTPException(status_code=400, detail="Only CSV files are supported.")
     try:
         with NamedTemporaryFile(delete=False, suffix=".csv") as tmp:
-            shutil.copyfileobj(file.file, tmp)
+            await run_in_threadpool(copy_upload, file, tmp)
             tmp_path = tmp.name
-        df = read_csv(tmp_path)
-        structure = {
-            "columns": [to_serializable(col) for col in df.columns.tolist()],
-            "row_count": int(len(df)),
-            "preview": [{k: to_serializable(v) for k, v in row.items()} for row in df.head(5).to_dict(orient="records")]
-        }
-        cleaning_engine = CleaningEngine()
-        cleaning_results = cleaning_engine.process_data(df)
+        if os.path.getsize(tmp_path) >= CHUNKED_PROCESSING_MIN_BYTES:
+            structure, cleaning_results = await run_in_threadpool(clean_in_chunks, tmp_path, 'csv')
+        else:
+            df = await run_in_threadpool(read_csv_file, tmp_path)
+            structure = {
+                "columns": df.columns.tolist(),
+                "row_count": int(len(df)),
+                "preview": df.head(5).to_dict(orient="records")
+            }
+            cleaning_results = await run_in_threadpool(_CLEANING_ENGINE.process_data, df)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to process CSV file: {str(e)}")
     finally:
@@ -111,7 +271,7 @@ async def analyze_csv_file(
             os.remove(tmp_path)
         except Exception:
             pass
-    return JSONResponse(content=to_serializable({"structure": structure, "cleaning_results": cleaning_results}))
+    return DataJSONResponse({"structure": structure, "cleaning_results": cleaning_results})
 
 @router.post("/analyze-excel", summary="Upload and analyze Excel file")
 async def analyze_excel_file(
@@ -124,27 +284,15 @@ async def analyze_excel_file(
         raise HTTPException(status_code=400, detail="Only Excel files (.xls, .xlsx) are supported.")
     try:
         with NamedTemporaryFile(delete=False, suffix=".xlsx") as tmp:
-            shutil.copyfileobj(file.file, tmp)
+            await run_in_threadpool(copy_upload, file, tmp)
             tmp_path = tmp.name
-        wb = openpyxl.load_workbook(tmp_path, read_only=True)
-        sheet = wb.active
-        columns = [cell.value for cell in next(sheet.iter_rows(min_row=1, max_row=1))]
-        row_count = sheet.max_row - 1
-        preview = []
-        for i, row in enumerate(sheet.iter_rows(min_row=2, max_row=6), start=1):
-            preview.append({columns[j]: cell.value for j, cell in enumerate(row)})
-        import pandas as pd
-        data = list(sheet.values)
-        df = pd.DataFrame(data[1:], columns=data[0])
+        df = await run_in_threadpool(read_excel_file, tmp_path)
         structure = {
-            "columns": [to_serializable(col) for col in columns],
-            "row_count": int(row_count),
-            "preview": [
-                {k: to_serializable(v) for k, v in row.items()} for row in preview
-            ]
+            "columns": df.columns.tolist(),
+            "row_count": int(len(df)),
+            "preview": df.head(5).to_dict(orient="records")
         }
-        cleaning_engine = CleaningEngine()
-        cleaning_results = cleaning_engine.process_data(df)
+        cleaning_results = await run_in_threadpool(_CLEANING_ENGINE.process_data, df)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to process Excel file: {str(e)}")
     finally:
@@ -152,24 +300,20 @@ async def analyze_excel_file(
             os.remove(tmp_path)
         except Exception:
             pass
-    return JSONResponse(content=to_serializable({"structure": structure, "cleaning_results": cleaning_results}))
+    return DataJSONResponse({"structure": structure, "cleaning_results": cleaning_results})
 
 @router.post("/upload-and-register", summary="Upload file and register in DB")
 async def upload_and_register_file(
-    file: UploadFile = File(...),
-    db: Session = Depends(get_db)
+    file: UploadFile = File(...)
 ):
     """
     Upload a file, save to disk, and register in DataFile DB table.
     Returns file_id for analysis endpoints.
     No project_id is required or set.
     Also runs basic cleaning and returns structure and cleaning results.
+    Files whose contents were already uploaded and analyzed return the
+    existing file_id and stored results without being cleaned again.
     """
-    import traceback
-    import openpyxl
-    import pandas as pd
-    import pyreadstat
-    from backend.cleaning_engine import CleaningEngine
     try:
         # Save file to disk
         ext = os.path.splitext(file.filename)[1].lower()
@@ -181,66 +325,67 @@ async def upload_and_register_file(
         )
         if file_type == 'unknown':
             raise HTTPException(status_code=400, detail="Unsupported file type.")
-        uploads_dir = os.path.join(os.getcwd(), 'uploads')
-        os.makedirs(uploads_dir, exist_ok=True)
-        file_path = os.path.join(uploads_dir, file.filename)
-        with open(file_path, 'wb') as out_file:
-            shutil.copyfileobj(file.file, out_file)
-        file_size = os.path.getsize(file_path)
-        # Register in DB without project_id
-        data_file = DataFile(
-            original_filename=file.filename,
-            file_size=file_size,
-            file_type=file_type,
-            upload_status='completed'
-        )
-        db.add(data_file)
-        db.commit()
-        db.refresh(data_file)
+        file_path, content_hash, file_size = await run_in_threadpool(save_upload, file)
+        # Same contents uploaded before: reuse its row and results
+        cached = await run_in_threadpool(find_analyzed_upload, content_hash)
+        if cached is not None:
+            file_id, analysis_cache = cached
+            return DataJSONResponse({
+                "file_id": file_id,
+                **analysis_cache,
+                "check_docs": _CHECK_DOCS
+            })
         # Run basic cleaning and structure analysis
         structure = None
         cleaning_results = None
         check_docs = None
+        df = None
         try:
-            if file_type == 'sav':
-                df, meta = pyreadstat.read_sav(file_path)
+            if file_type in ('sav', 'csv') and file_size >= CHUNKED_PROCESSING_MIN_BYTES:
+                structure, cleaning_results = await run_in_threadpool(clean_in_chunks, file_path, file_type)
+            elif file_type == 'sav':
+                df, meta = await run_in_threadpool(read_sav_file, file_path)
                 structure = {
                     "columns": [str(col) for col in df.columns.tolist()],
                     "row_count": int(len(df)),
                     "preview": df.head(5).to_dict(orient="records")
                 }
             elif file_type == 'csv':
-                df = pd.read_csv(file_path)
+                df = await run_in_threadpool(read_csv_file, file_path)
                 structure = {
                     "columns": [str(col) for col in df.columns.tolist()],
                     "row_count": int(len(df)),
                     "preview": df.head(5).to_dict(orient="records")
                 }
             elif file_type == 'excel':
-                wb = openpyxl.load_workbook(file_path, read_only=True)
-                sheet = wb.active
-                columns = [cell.value for cell in next(sheet.iter_rows(min_row=1, max_row=1))]
-                row_count = sheet.max_row - 1
-                preview = []
-                for i, row in enumerate(sheet.iter_rows(min_row=2, max_row=6), start=1):
-                    preview.append({columns[j]: cell.value for j, cell in enumerate(row)})
-                import pandas as pd
-                data = list(sheet.values)
-                df = pd.DataFrame(data[1:], columns=data[0])
+                df = await run_in_threadpool(read_excel_file, file_path)
                 structure = {
-                    "columns": [str(col) for col in columns],
-                    "row_count": int(row_count),
-                    "preview": preview
+                    "columns": [str(col) for col in df.columns.tolist()],
+                    "row_count": int(len(df)),
+                    "preview": df.head(5).to_dict(orient="records")
                 }
+            if df is not None:
+                # Analysis endpoints memory-map this copy instead of re-parsing
+                await run_in_threadpool(write_arrow_copy, df, file_path)
             # Run cleaning
-            cleaning_engine = CleaningEngine()
-            cleaning_results = cleaning_engine.process_data(df)
-            check_docs = cleaning_engine.get_check_documentation()
+            if cleaning_results is None:
+                cleaning_results = await run_in_threadpool(_CLEANING_ENGINE.process_data, df)
+            check_docs = _CHECK_DOCS
+            # Stored as plain JSON so later uploads can return it as is
+            analysis_cache = orjson.loads(_dumps({
+                "structure": structure,
+                "cleaning_results": cleaning_results
+            }))
         except Exception as clean_exc:
             cleaning_results = {"error": str(clean_exc)}
             check_docs = {}
-        return to_serializable({
-            "file_id": str(data_file.id),
+            analysis_cache = None
+        # Register in DB without project_id
+        file_id = await run_in_threadpool(
+            register_data_file, file.filename, file_size, file_type, content_hash, analysis_cache
+        )
+        return DataJSONResponse({
+            "file_id": file_id,
             "structure": structure,
             "cleaning_results": cleaning_results,
             "check_docs": check_docs
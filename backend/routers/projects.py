@@ -1,6 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import select, update
 from sqlalchemy.orm import Session
 from typing import List
+from uuid import UUID
 
 from backend.database.base import get_db
 from backend.models import User, Project
@@ -13,6 +15,45 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
+def _get_owned_project(db: Session, project_id: UUID, user: User) -> Project:
+    """
+    Fetch a project the user is allowed to access.
+
+    Ownership is checked in the same query as the lookup, so the common
+    case costs a single round trip; only a miss is followed by a second
+    query to tell a missing project from a forbidden one. Admins may see
+    any project, so theirs is a plain primary-key get.
+    
+    Args:
+        db (Session): Database session
+        project_id (UUID): Project ID
+        user (User): User requesting the project
+        
+    Returns:
+        Project: The requested project
+        
+    Raises:
+        HTTPException: If project not found or unauthorized
+    """
+    if user.role == "admin":
+        project = db.get(Project, project_id)
+    else:
+        project = db.execute(
+            select(Project).where(Project.id == project_id, Project.owner_id == user.id)
+        ).scalar_one_or_none()
+    if project is not None:
+        return project
+    
+    if user.role == "admin" or db.get(Project, project_id) is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Project not found"
+        )
+    raise HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail="Not enough permissions"
+    )
+
 @router.post("/", response_model=ProjectInDB)
 async def create_project(
     project: ProjectCreate,
@@ -65,7 +106,7 @@ async def read_projects(
 
 @router.get("/{project_id}", response_model=ProjectInDB)
 async def read_project(
-    project_id: str,
+    project_id: UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
@@ -73,7 +114,7 @@ async def read_project(
     Get project by ID.
     
     Args:
-        project_id (str): Project ID
+        project_id (UUID): Project ID
         db (Session): Database session
         current_user (User): Current authenticated user
         
@@ -83,22 +124,12 @@ async def read_project(
     Raises:
         HTTPException: If project not found or unauthorized
     """
-    project = db.query(Project).filter(Project.id == project_id).first()
-    if project is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Project not found"
-        )
-    if project.owner_id != current_user.id and current_user.role != "admin":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not enough permissions"
-        )
+    project = _get_owned_project(db, project_id, current_user)
     return project
 
 @router.put("/{project_id}", response_model=ProjectInDB)
 async def update_project(
-    project_id: str,
+    project_id: UUID,
     project_update: ProjectUpdate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
@@ -107,7 +138,7 @@ async def update_project(
     Update project information.
     
     Args:
-        project_id (str): Project ID
+        project_id (UUID): Project ID
         project_update (ProjectUpdate): Updated project data
         db (Session): Database session
         current_user (User): Current authenticated user
@@ -118,28 +149,26 @@ async def update_project(
     Raises:
         HTTPException: If project not found or unauthorized
     """
-    project = db.query(Project).filter(Project.id == project_id).first()
-    if project is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Project not found"
-        )
-    if project.owner_id != current_user.id and current_user.role != "admin":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not enough permissions"
-        )
+    project = _get_owned_project(db, project_id, current_user)
     
-    for field, value in project_update.dict(exclude_unset=True).items():
-        setattr(project, field, value)
+    values = project_update.dict(exclude_unset=True)
+    if not values:
+        return project
     
+    # Single UPDATE ... RETURNING instead of per-attribute writes plus a refresh
+    updated = db.execute(
+        update(Project)
+        .where(Project.id == project.id)
+        .values(**values)
+        .returning(*Project.__table__.c)
+        .execution_options(synchronize_session=False)
+    ).mappings().one()
     db.commit()
-    db.refresh(project)
-    return project
+    return updated
 
 @router.delete("/{project_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_project(
-    project_id: str,
+    project_id: UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
@@ -147,24 +176,14 @@ async def delete_project(
     Delete a project.
     
     Args:
-        project_id (str): Project ID
+        project_id (UUID): Project ID
         db (Session): Database session
         current_user (User): Current authenticated user
         
     Raises:
         HTTPException: If project not found or unauthorized
     """
-    project = db.query(Project).filter(Project.id == project_id).first()
-    if project is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Project not found"
-        )
-    if project.owner_id != current_user.id and current_user.role != "admin":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not enough permissions"
-        )
+    project = _get_owned_project(db, project_id, current_user)
     
     db.delete(project)
     db.commit() 
\ No newline at end of file
@@ -1,6 +1,9 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from starlette.concurrency import run_in_threadpool
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 from typing import List
+from uuid import UUID
 
 from backend.database.base import get_db
 from backend.models import User
@@ -56,7 +59,8 @@ async def create_user(
         )
     
     # Create new user
-    hashed_password = get_password_hash(user.password)
+    # bcrypt is deliberately slow; keep it off the event loop
+    hashed_password = await run_in_threadpool(get_password_hash, user.password)
     db_user = User(
         email=user.email,
         name=user.name,
@@ -98,12 +102,20 @@ async def update_user_me(
     Returns:
         UserInDB: Updated user information
     """
-    for field, value in user_update.dict(exclude_unset=True).items():
-        setattr(current_user, field, value)
+    values = user_update.dict(exclude_unset=True)
+    if not values:
+        return current_user
     
+    # Single UPDATE ... RETURNING instead of per-attribute writes plus a refresh
+    updated = db.execute(
+        update(User)
+        .where(User.id == current_user.id)
+        .values(**values)
+        .returning(*User.__table__.c)
+        .execution_options(synchronize_session=False)
+    ).mappings().one()
     db.commit()
-    db.refresh(current_user)
-    return current_user
+    return updated
 
 @router.get("/", response_model=List[UserInDB])
 async def read_users(
@@ -138,7 +150,7 @@ async def read_users(
 
 @router.get("/{user_id}", response_model=UserInDB)
 async def read_user(
-    user_id: str,
+    user_id: UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
@@ -146,7 +158,7 @@ async def read_user(
     Get user by ID.
     
     Args:
-        user_id (str): User ID
+        user_id (UUID): User ID
         db (Session): Database session
         current_user (User): Current authenticated user
         
@@ -162,7 +174,7 @@ async def read_user(
             detail="Not enough permissions"
         )
     
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id)
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -172,7 +184,7 @@ async def read_user(
 
 @router.put("/{user_id}", response_model=UserInDB)
 async def update_user(
-    user_id: str,
+    user_id: UUID,
     user_update: UserUpdate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
@@ -181,7 +193,7 @@ async def update_user(
     Update user information.
     
     Args:
-        user_id (str): User ID
+        user_id (UUID): User ID
         user_update (UserUpdate): Updated user data
         db (Session): Database session
         current_user (User): Current authenticated user
@@ -198,16 +210,22 @@ async def update_user(
             detail="Not enough permissions"
         )
     
-    user = db.query(User).filter(User.id == user_id).first()
+    values = user_update.dict(exclude_unset=True)
+    if values:
+        user = db.execute(
+            update(User)
+            .where(User.id == user_id)
+            .values(**values)
+            .returning(*User.__table__.c)
+            .execution_options(synchronize_session=False)
+        ).mappings().first()
+    else:
+        user = db.get(User, user_id)
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found"
         )
     
-    for field, value in user_update.dict(exclude_unset=True).items():
-        setattr(user, field, value)
-    
     db.commit()
-    db.refresh(user)
     return user 
\ No newline at end of file
@@ -1,39 +1,46 @@
-from fastapi import APIRouter, HTTPException, Depends
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, HTTPException
+from starlette.concurrency import run_in_threadpool
 from backend.models import DataFile
 from backend.app.core.advanced_scrubbing import AdvancedScrubbing
 from backend.app.core.bot_detection import BotDetector
 from backend.app.core.nlp_engine import NLEngine
-from backend.services.spss_processor import SPSSProcessor
-from backend.database.base import get_db
-import pandas as pd
+from backend.database.base import session_scope
+from backend.services.file_loader import read_uploaded_file, upload_path
 from pydantic import BaseModel
+from uuid import UUID
+import pandas as pd
 import traceback
-import os
 
 router = APIRouter(prefix="/api", tags=["analysis"])
 
 class FileIdRequest(BaseModel):
-    file_id: str
+    file_id: UUID
+
+def _load_data_file(file_id: UUID) -> DataFile:
+    """
+    Look up a data file and detach it from its session.
+
+    The session is closed before returning so no pooled connection is held
+    while the caller parses the file.
+    """
+    with session_scope() as db:
+        data_file = db.get(DataFile, file_id)
+        if not data_file:
+            raise HTTPException(status_code=404, detail="Data file not found")
+        db.expunge(data_file)
+    return data_file
 
 @router.post("/advanced-scrubbing")
-async def run_advanced_scrubbing(request: FileIdRequest, db: Session = Depends(get_db)):
-    data_file = db.query(DataFile).filter(DataFile.id == request.file_id).first()
-    if not data_file:
-        raise HTTPException(status_code=404, detail="Data file not found")
+async def run_advanced_scrubbing(request: FileIdRequest):
+    data_file = await run_in_threadpool(_load_data_file, request.file_id)
     try:
-        file_path = os.path.join(os.getcwd(), 'uploads', data_file.original_filename)
-        if data_file.file_type == 'sav':
-            spss = SPSSProcessor()
-            spss.load_file(file_path)
-            df = spss.data
-        else:
-            df = pd.read_csv(file_path)
+        file_path = upload_path(data_file.original_filename, data_file.content_hash)
+        df = await run_in_threadpool(read_uploaded_file, file_path, data_file.file_type)
         scrubbing = AdvancedScrubbing()
         results = {}
         summary = {}
         if 'text' in df.columns:
-            brevity = scrubbing.check_response_brevity(df, 'text')
+            brevity = await run_in_threadpool(scrubbing.check_response_brevity, df, 'text')
             results['response_brevity'] = brevity
             summary['brief_responses'] = brevity['brief_responses']
         else:
@@ -44,47 +51,37 @@ async def run_advanced_scrubbing(request: FileIdRequest, db: Session = Depends(g
         raise HTTPException(status_code=500, detail=f"Advanced scrubbing failed: {str(e)}")
 
 @router.post("/bot-detection")
-async def run_bot_detection(request: FileIdRequest, db: Session = Depends(get_db)):
-    data_file = db.query(DataFile).filter(DataFile.id == request.file_id).first()
-    if not data_file:
-        raise HTTPException(status_code=404, detail="Data file not found")
+async def run_bot_detection(request: FileIdRequest):
+    data_file = await run_in_threadpool(_load_data_file, request.file_id)
     try:
-        file_path = os.path.join(os.getcwd(), 'uploads', data_file.original_filename)
-        if data_file.file_type == 'sav':
-            spss = SPSSProcessor()
-            spss.load_file(file_path)
-            df = spss.data
-        else:
-            df = pd.read_csv(file_path)
+        file_path = upload_path(data_file.original_filename, data_file.content_hash)
+        df = await run_in_threadpool(read_uploaded_file, file_path, data_file.file_type)
         detector = BotDetector()
-        text_columns = [col for col in df.columns if df[col].dtype == object]
+        text_columns = df.select_dtypes(include=['object', 'string']).columns.tolist()
         if not text_columns:
             return {"summary": {}, "detailed_results": {}, "error": "No text columns found in data."}
-        patterns = detector.analyze_patterns(df, text_columns)
+        patterns = await run_in_threadpool(detector.analyze_patterns, df, text_columns)
         return {"summary": {"patterns_found": patterns['patterns_found']}, "detailed_results": patterns}
     except Exception as e:
         print(traceback.format_exc())
         raise HTTPException(status_code=500, detail=f"Bot detection failed: {str(e)}")
 
 @router.post("/nlp-engine")
-async def run_nlp_engine(request: FileIdRequest, db: Session = Depends(get_db)):
-    data_file = db.query(DataFile).filter(DataFile.id == request.file_id).first()
-    if not data_file:
-        raise HTTPException(status_code=404, detail="Data file not found")
+async def run_nlp_engine(request: FileIdRequest):
+    data_file = await run_in_threadpool(_load_data_file, request.file_id)
     try:
-        file_path = os.path.join(os.getcwd(), 'uploads', data_file.original_filename)
-        if data_file.file_type == 'sav':
-            spss = SPSSProcessor()
-            spss.load_file(file_path)
-            df = spss.data
-        else:
-            df = pd.read_csv(file_path)
+        file_path = upload_path(data_file.original_filename, data_file.content_hash)
+        df = await run_in_threadpool(read_uploaded_file, file_path, data_file.file_type)
         nlp = NLEngine()
-        text_columns = [col for col in df.columns if df[col].dtype == object]
+        text_columns = df.select_dtypes(include=['object', 'string']).columns.tolist()
         if not text_columns:
             return {"summary": {}, "detailed_results": {}, "error": "No text columns found in data."}
-        texts = df[text_columns[0]].dropna().astype(str).tolist()
-        sentiment = nlp.analyze_sentiment(texts)
+        series = df[text_columns[0]].dropna()
+        # Only convert when the column holds something other than strings
+        if pd.api.types.infer_dtype(series, skipna=False) != 'string':
+            series = series.astype(str)
+        texts = series.tolist()
+        sentiment = await run_in_threadpool(nlp.analyze_sentiment, texts)
         return {"summary": {"average_sentiment": sentiment.get('average_sentiment')}, "detailed_results": sentiment}
     except Exception as e:
         print(traceback.format_exc())
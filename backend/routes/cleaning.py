@@ -1,18 +1,31 @@
+import os
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from typing import Dict, Any, Optional
+from uuid import UUID
 import pandas as pd
 from datetime import datetime
-from pydantic import BaseModel
+from pydantic import BaseModel, model_validator
+from starlette.concurrency import run_in_threadpool
 
 from backend.database.base import get_db
 from backend.models import DataFile, CleaningResult, CleaningCheck, User
 from backend.schemas import CleaningResultBase, CleaningResultUpdate
 from backend.cleaning_engine import CleaningEngine
+from backend.services.file_loader import (
+    read_uploaded_file, iter_df_chunks, upload_path, CHUNKED_PROCESSING_MIN_BYTES
+)
 from backend.security import get_current_user
 
 router = APIRouter(prefix="/api/v1/cleaning", tags=["cleaning"])
 
+# Engine for requests without a custom config, and the static documentation
+# of its checks; both are built once per process
+_CLEANING_ENGINE = CleaningEngine()
+_CHECK_DOCS = _CLEANING_ENGINE.get_check_documentation()
+
 class CleaningConfig(BaseModel):
     """Configuration for cleaning checks."""
     required_fields: Optional[list[str]] = None
@@ -25,6 +38,20 @@ class CleaningRequest(BaseModel):
     """Request model for cleaning operation."""
     data: Dict[str, Any]  # DataFrame serialized as dict
     config: Optional[CleaningConfig] = None
+    # NumPy dtypes of columns in data; typed columns skip pandas' type inference
+    dtypes: Optional[Dict[str, str]] = None
+
+    @model_validator(mode='after')
+    def check_dtypes(self) -> 'CleaningRequest':
+        """Reject dtypes for unknown columns and dtype names pandas cannot parse."""
+        for column, dtype in (self.dtypes or {}).items():
+            if column not in self.data:
+                raise ValueError(f"dtype given for unknown column '{column}'")
+            try:
+                pd.api.types.pandas_dtype(dtype)
+            except TypeError:
+                raise ValueError(f"invalid dtype '{dtype}' for column '{column}'")
+        return self
 
 class CleaningResponse(BaseModel):
     """Response model for cleaning operation."""
@@ -32,7 +59,30 @@ class CleaningResponse(BaseModel):
     detailed_results: Dict[str, Any]
     documentation: Dict[str, Any]
 
-@router.post("/process", response_model=CleaningResponse)
+def _request_frame(request: CleaningRequest) -> pd.DataFrame:
+    """
+    Build the DataFrame for a cleaning request.
+    
+    Columns with a declared dtype are built with that dtype directly;
+    pandas only infers the types of the remaining columns. Columns may be
+    lists of values or, as produced by DataFrame.to_dict(), mappings of
+    row labels to values.
+    
+    Args:
+        request (CleaningRequest): The cleaning request
+        
+    Returns:
+        pd.DataFrame: The request data
+    """
+    if not request.dtypes:
+        return pd.DataFrame(request.data)
+    return pd.DataFrame({
+        column: pd.Series(values, dtype=request.dtypes[column])
+        if column in request.dtypes else values
+        for column, values in request.data.items()
+    }, copy=False)
+
+@router.post("/process", response_model=CleaningResponse, response_class=ORJSONResponse)
 async def process_data(
     request: CleaningRequest,
     current_user: User = Depends(get_current_user)
@@ -48,22 +98,26 @@ async def process_data(
         CleaningResponse: Results of the cleaning operation
     """
     try:
-        # Convert data to DataFrame
-        df = pd.DataFrame(request.data)
-        
-        # Initialize cleaning engine with config
-        engine = CleaningEngine(request.config.dict() if request.config else None)
-        
-        # Process data
-        results = engine.process_data(df)
+        df = _request_frame(request)
+    except (TypeError, ValueError) as e:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Invalid data: {str(e)}"
+        )
+    
+    try:
+        # Unset options are left out so the engine falls back to its defaults;
+        # only a config that sets something needs its own engine
+        config = request.config.dict(exclude_none=True) if request.config else None
+        engine = CleaningEngine(config) if config else _CLEANING_ENGINE
         
-        # Get documentation
-        docs = engine.get_check_documentation()
+        # Process data off the event loop
+        results = await run_in_threadpool(engine.process_data, df)
         
         return CleaningResponse(
             summary=results['summary'],
             detailed_results=results['detailed_results'],
-            documentation=docs
+            documentation=_CHECK_DOCS
         )
     except Exception as e:
         raise HTTPException(
@@ -84,14 +138,7 @@ async def get_documentation(
     Returns:
         Dict[str, Any]: Documentation for all checks
     """
-    try:
-        engine = CleaningEngine()
-        return engine.get_check_documentation()
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Error getting documentation: {str(e)}"
-        )
+    return _CHECK_DOCS
 
 @router.get("/performance")
 async def get_performance_metrics(
@@ -104,23 +151,88 @@ async def get_performance_metrics(
         current_user (User): The authenticated user
         
     Returns:
-        Dict[str, Any]: Performance metrics
+        Dict[str, Any]: Performance metrics of the most recent run without
+            a custom config
     """
-    try:
-        engine = CleaningEngine()
-        return {
-            'check_times': engine.check_times,
-            'total_execution_time': engine.total_execution_time
-        }
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Error getting performance metrics: {str(e)}"
+    return {
+        'check_times': _CLEANING_ENGINE.check_times,
+        'total_execution_time': _CLEANING_ENGINE.total_execution_time
+    }
+
+def _run_cleaning(cleaning_engine: CleaningEngine, file_path: str, file_type: str) -> Dict[str, Any]:
+    """
+    Read an uploaded file and run it through the cleaning engine.
+    
+    Args:
+        cleaning_engine (CleaningEngine): Engine to run
+        file_path (str): Path of the stored upload
+        file_type (str): Type of the file ('sav', 'csv' or 'excel')
+        
+    Returns:
+        Dict[str, Any]: Results of each check
+    """
+    if file_type in ('sav', 'csv') and os.path.getsize(file_path) >= CHUNKED_PROCESSING_MIN_BYTES:
+        # Stream large files through the engine so memory stays bounded
+        return cleaning_engine.process_chunks(iter_df_chunks(file_path, file_type))
+    df = read_uploaded_file(file_path, file_type)
+    return cleaning_engine.process_data(df)
+
+def _save_cleaning_results(
+    db: Session,
+    cleaning_engine: CleaningEngine,
+    data_file: DataFile,
+    results: Dict[str, Any]
+) -> None:
+    """
+    Store the results of each check for a data file.
+    
+    Args:
+        db (Session): Database session
+        cleaning_engine (CleaningEngine): Engine that produced the results
+        data_file (DataFile): Cleaned data file
+        results (Dict[str, Any]): Report returned by the cleaning engine
+    """
+    check_results = results['detailed_results']
+    # Look up every check in one query and create the missing ones together
+    checks = {
+        check.name: check
+        for check in db.query(CleaningCheck).filter(CleaningCheck.name.in_(list(check_results))).all()
+    }
+    new_checks = [
+        CleaningCheck(
+            name=check_name,
+            description=cleaning_engine.checks[check_name]['description'],
+            category=cleaning_engine.checks[check_name]['category']
         )
+        for check_name in check_results if check_name not in checks
+    ]
+    if new_checks:
+        db.add_all(new_checks)
+        db.flush()
+        checks.update((check.name, check) for check in new_checks)
+    
+    # Results are written with one bulk INSERT; no objects need tracking.
+    # Data files belong to no project, so the results have none either
+    completed_at = datetime.utcnow()
+    rows = [
+        {
+            'data_file_id': data_file.id,
+            'check_id': checks[check_name].id,
+            'status': check_result['status'],
+            'issues_found': check_result['issues_found'],
+            'details': check_result.get('details', {}),
+            'completed_at': completed_at
+        }
+        for check_name, check_result in check_results.items()
+    ]
+    if rows:
+        db.execute(insert(CleaningResult), rows)
+    
+    db.commit()
 
-@router.post("/{data_file_id}/clean", response_model=Dict[str, Any])
+@router.post("/{data_file_id}/clean", response_model=Dict[str, Any], response_class=ORJSONResponse)
 async def clean_data_file(
-    data_file_id: str,
+    data_file_id: UUID,
     config: Dict[str, Any] = None,
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
@@ -129,7 +241,7 @@ async def clean_data_file(
     Clean a data file using the cleaning engine.
     
     Args:
-        data_file_id (str): ID of the data file to clean
+        data_file_id (UUID): ID of the data file to clean
         config (Dict[str, Any], optional): Configuration for cleaning checks
         db (Session): Database session
         current_user: Current authenticated user
@@ -138,7 +250,7 @@ async def clean_data_file(
         Dict[str, Any]: Results of the cleaning process
     """
     # Get data file
-    data_file = db.query(DataFile).filter(DataFile.id == data_file_id).first()
+    data_file = db.get(DataFile, data_file_id)
     if not data_file:
         raise HTTPException(status_code=404, detail="Data file not found")
     
@@ -146,43 +258,13 @@ async def clean_data_file(
     cleaning_engine = CleaningEngine(config)
     
     try:
-        # Read data file
-        if data_file.file_type == 'sav':
-            import pyreadstat
-            df, meta = pyreadstat.read_sav(data_file.file_path)
-        else:
-            df = pd.read_csv(data_file.file_path)
-        
-        # Process data through cleaning engine
-        results = cleaning_engine.process_data(df)
-        
-        # Save cleaning results
-        for check_name, check_result in results.items():
-            cleaning_check = db.query(CleaningCheck).filter(
-                CleaningCheck.name == check_name
-            ).first()
-            
-            if not cleaning_check:
-                cleaning_check = CleaningCheck(
-                    name=check_name,
-                    description=cleaning_engine.checks[check_name]['description'],
-                    category=cleaning_engine.checks[check_name]['category']
-                )
-                db.add(cleaning_check)
-                db.flush()
-            
-            cleaning_result = CleaningResult(
-                project_id=data_file.project_id,
-                data_file_id=data_file.id,
-                check_id=cleaning_check.id,
-                status=check_result['status'],
-                issues_found=check_result['issues_found'],
-                details=check_result.get('details', {}),
-                completed_at=datetime.utcnow()
-            )
-            db.add(cleaning_result)
-        
-        db.commit()
+        file_path = upload_path(data_file.original_filename, data_file.content_hash)
+        # Reading, cleaning and saving all block, so they run in the
+        # threadpool to keep the event loop free for other requests
+        results = await run_in_threadpool(
+            _run_cleaning, cleaning_engine, file_path, data_file.file_type
+        )
+        await run_in_threadpool(_save_cleaning_results, db, cleaning_engine, data_file, results)
         
         return {
             'status': 'success',
@@ -191,12 +273,12 @@ async def clean_data_file(
         }
         
     except Exception as e:
-        db.rollback()
+        await run_in_threadpool(db.rollback)
         raise HTTPException(status_code=500, detail=str(e))
 
-@router.get("/{data_file_id}/results", response_model=Dict[str, Any])
+@router.get("/{data_file_id}/results", response_model=Dict[str, Any], response_class=ORJSONResponse)
 async def get_cleaning_results(
-    data_file_id: str,
+    data_file_id: UUID,
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
 ):
@@ -204,7 +286,7 @@ async def get_cleaning_results(
     Get cleaning results for a data file.
     
     Args:
-        data_file_id (str): ID of the data file
+        data_file_id (UUID): ID of the data file
         db (Session): Database session
         current_user: Current authenticated user
     
@@ -212,12 +294,18 @@ async def get_cleaning_results(
         Dict[str, Any]: Cleaning results
     """
     # Get data file
-    data_file = db.query(DataFile).filter(DataFile.id == data_file_id).first()
+    data_file = db.get(DataFile, data_file_id)
     if not data_file:
         raise HTTPException(status_code=404, detail="Data file not found")
     
-    # Get cleaning results
-    results = db.query(CleaningResult).filter(
+    # Get cleaning results with their check names in one joined query
+    results = db.query(
+        CleaningCheck.name,
+        CleaningResult.status,
+        CleaningResult.issues_found,
+        CleaningResult.details,
+        CleaningResult.completed_at
+    ).join(CleaningResult.check).filter(
         CleaningResult.data_file_id == data_file_id
     ).all()
     
@@ -225,7 +313,7 @@ async def get_cleaning_results(
         'data_file_id': data_file_id,
         'results': [
             {
-                'check_name': result.check.name,
+                'check_name': result.name,
                 'status': result.status,
                 'issues_found': result.issues_found,
                 'details': result.details,
@@ -1,10 +1,15 @@
-from pydantic import BaseModel, EmailStr, UUID4, Field
-from typing import Optional, List, Dict, Any
+from pydantic import BaseModel, ConfigDict, StringConstraints, UUID4, Field
+from typing import Annotated, Optional, List, Dict, Any
 from datetime import datetime
 
+# Checked by pydantic-core's compiled regex engine, without the per-request
+# parsing of email_validator
+EMAIL_PATTERN = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+Email = Annotated[str, StringConstraints(pattern=EMAIL_PATTERN)]
+
 # User schemas
 class UserBase(BaseModel):
-    email: EmailStr
+    email: Email
     name: str
     role: str = "analyst"
 
@@ -22,8 +27,7 @@ class UserInDB(UserBase):
     created_at: datetime
     last_login: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 # Project schemas
 class ProjectBase(BaseModel):
@@ -45,8 +49,7 @@ class ProjectInDB(ProjectBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 # Data file schemas
 class DataFileBase(BaseModel):
@@ -66,8 +69,7 @@ class DataFileInDB(DataFileBase):
     upload_status: str
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 # Cleaning check schemas
 class CleaningCheckBase(BaseModel):
@@ -91,12 +93,11 @@ class CleaningCheckInDB(CleaningCheckBase):
     id: UUID4
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 # Cleaning result schemas
 class CleaningResultBase(BaseModel):
-    project_id: UUID4
+    project_id: Optional[UUID4] = None
     data_file_id: UUID4
     check_id: UUID4
     status: str = "pending"
@@ -117,8 +118,7 @@ class CleaningResultInDB(CleaningResultBase):
     created_at: datetime
     completed_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 # Response schemas
 class ResponseBase(BaseModel):
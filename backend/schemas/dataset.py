@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, Dict, Any
 from datetime import datetime
 from uuid import UUID
@@ -7,7 +7,7 @@ class DatasetBase(BaseModel):
     """Base schema for dataset data."""
     name: str = Field(..., min_length=1, max_length=100)
     description: Optional[str] = Field(None, max_length=500)
-    file_type: str = Field(..., regex="^(spss|csv|excel|json)$")
+    file_type: str = Field(..., pattern="^(spss|csv|excel|json)$")
 
 class DatasetCreate(DatasetBase):
     """Schema for creating a new dataset."""
@@ -30,5 +30,4 @@ class DatasetInDB(DatasetBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        orm_mode = True 
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True) 
\ No newline at end of file
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional
 from datetime import datetime
 from uuid import UUID
@@ -7,7 +7,7 @@ class ProjectBase(BaseModel):
     """Base schema for project data."""
     name: str = Field(..., min_length=1, max_length=100)
     description: Optional[str] = Field(None, max_length=500)
-    status: str = Field(..., regex="^(active|archived|completed)$")
+    status: str = Field(..., pattern="^(active|archived|completed)$")
 
 class ProjectCreate(ProjectBase):
     """Schema for creating a new project."""
@@ -17,7 +17,7 @@ class ProjectUpdate(BaseModel):
     """Schema for updating a project."""
     name: Optional[str] = Field(None, min_length=1, max_length=100)
     description: Optional[str] = Field(None, max_length=500)
-    status: Optional[str] = Field(None, regex="^(active|archived|completed)$")
+    status: Optional[str] = Field(None, pattern="^(active|archived|completed)$")
 
 class ProjectInDB(ProjectBase):
     """Schema for project data as stored in database."""
@@ -26,5 +26,4 @@ class ProjectInDB(ProjectBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        orm_mode = True 
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True) 
\ No newline at end of file
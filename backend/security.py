@@ -1,8 +1,11 @@
 from datetime import datetime, timedelta
 from typing import Optional
+from uuid import UUID
+from cachetools import TTLCache
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
 
@@ -21,10 +24,18 @@ pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 # OAuth2 scheme
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
+# Verified tokens -> (user id, expiry), so repeat requests with the same
+# token skip JWT verification and load the user by primary key
+TOKEN_CACHE_TTL_SECONDS = 30
+_token_cache = TTLCache(maxsize=10_000, ttl=TOKEN_CACHE_TTL_SECONDS)
+
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     Verify a password against its hash.
     
+    bcrypt is deliberately slow, so the check runs in the threadpool rather
+    than blocking the event loop.
+    
     Args:
         plain_password (str): The plain text password
         hashed_password (str): The hashed password
@@ -32,7 +43,7 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         bool: True if password matches hash, False otherwise
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    return await run_in_threadpool(pwd_context.verify, plain_password, hashed_password)
 
 def get_password_hash(password: str) -> str:
     """
@@ -66,6 +77,25 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
+def _token_data(subject: str, email: Optional[str] = None) -> TokenData:
+    """
+    Parse the subject of an access token.
+    
+    Tokens carry the user's ID as subject so the user is loaded by primary
+    key; tokens with an email subject are still accepted.
+    
+    Args:
+        subject (str): The token's "sub" claim
+        email (Optional[str]): The token's "email" claim, if any
+        
+    Returns:
+        TokenData: The user ID or email the token identifies
+    """
+    try:
+        return TokenData(user_id=UUID(subject), email=email)
+    except ValueError:
+        return TokenData(email=subject)
+
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
     db: Session = Depends(get_db)
@@ -88,18 +118,29 @@ async def get_current_user(
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+    cached = _token_cache.get(token)
+    if cached is not None and cached[1] > datetime.utcnow():
+        user = db.get(User, cached[0])
+        if user is not None:
+            return user
+    
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        email: str = payload.get("sub")
-        if email is None:
+        subject: str = payload.get("sub")
+        if subject is None:
             raise credentials_exception
-        token_data = TokenData(email=email)
+        token_data = _token_data(subject, payload.get("email"))
     except JWTError:
         raise credentials_exception
     
-    user = db.query(User).filter(User.email == token_data.email).first()
+    if token_data.user_id is not None:
+        user = db.get(User, token_data.user_id)
+    else:
+        user = db.query(User).filter(User.email == token_data.email).first()
     if user is None:
         raise credentials_exception
+    if "exp" in payload:
+        _token_cache[token] = (user.id, datetime.utcfromtimestamp(payload["exp"]))
     return user
 
 async def get_current_active_user(
@@ -0,0 +1,242 @@
+import logging
+import os
+from typing import Any, Iterator, Optional, Tuple
+
+import openpyxl
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyreadstat
+from python_calamine import CalamineWorkbook
+
+logger = logging.getLogger(__name__)
+
+# Directory stored uploads live in, resolved once at import
+UPLOADS_DIR = os.getenv('UPLOADS_DIR', os.path.join(os.getcwd(), 'uploads'))
+
+# Size of the blocks the Arrow CSV reader tokenizes in parallel
+CSV_BLOCK_SIZE = 8 << 20
+
+# SPSS files from this size on are parsed by several processes; below it
+# the cost of spawning workers outweighs the parallel speedup
+SAV_MULTIPROCESSING_MIN_BYTES = 50 * 1024 * 1024
+
+# Rows per chunk when a file is too large to load in one piece
+CSV_CHUNK_SIZE = 256_000
+SAV_CHUNK_SIZE = 100_000
+
+# CSV and SPSS files from this size on are cleaned chunk by chunk
+CHUNKED_PROCESSING_MIN_BYTES = 256 * 1024 * 1024
+
+# Suffix of the Arrow IPC copy kept next to a stored upload
+ARROW_COPY_SUFFIX = '.arrow'
+
+def upload_path(filename: str, content_hash: Optional[str] = None) -> str:
+    """
+    Path of a stored upload in the uploads directory.
+
+    Uploads are stored under their content hash with the original extension.
+    Files registered before uploads were hashed keep their original name.
+
+    Args:
+        filename (str): Original name of the uploaded file.
+        content_hash (str, optional): Hex digest of the file contents.
+
+    Returns:
+        str: Absolute path of the stored file.
+    """
+    if content_hash:
+        filename = content_hash + os.path.splitext(filename)[1].lower()
+    return os.path.join(UPLOADS_DIR, filename)
+
+def read_csv_file(file_path: str) -> pd.DataFrame:
+    """
+    Read a CSV file into a DataFrame using Arrow's multithreaded parser.
+
+    Args:
+        file_path (str): Path to the CSV file.
+
+    Returns:
+        pd.DataFrame: Parsed data. Empty fields are read as missing values
+            and dates, times and timestamps are kept as strings, as they are
+            by pandas.read_csv.
+    """
+    read_options = pa_csv.ReadOptions(use_threads=True, block_size=CSV_BLOCK_SIZE)
+    table = pa_csv.read_csv(
+        file_path,
+        read_options=read_options,
+        convert_options=pa_csv.ConvertOptions(strings_can_be_null=True)
+    )
+    # Arrow infers dates, times and timestamps where pandas keeps the text;
+    # read those columns again as strings so the raw values are preserved
+    temporal = [
+        field.name for field in table.schema
+        if pa.types.is_temporal(field.type)
+    ]
+    if temporal:
+        text = pa_csv.read_csv(
+            file_path,
+            read_options=read_options,
+            convert_options=pa_csv.ConvertOptions(
+                strings_can_be_null=True,
+                include_columns=temporal,
+                column_types={name: pa.string() for name in temporal}
+            )
+        )
+        for name in temporal:
+            table = table.set_column(
+                table.schema.get_field_index(name), name, text.column(name)
+            )
+    # self_destruct frees each Arrow column as soon as it has been converted,
+    # so the table and the DataFrame are not both held in memory
+    return table.to_pandas(split_blocks=True, self_destruct=True)
+
+def read_sav_file(file_path: str) -> Tuple[pd.DataFrame, Any]:
+    """
+    Read an SPSS (.sav) file, splitting large files across processes.
+
+    Args:
+        file_path (str): Path to the SPSS file.
+
+    Returns:
+        tuple: The data as a DataFrame and the pyreadstat metadata.
+    """
+    if os.path.getsize(file_path) >= SAV_MULTIPROCESSING_MIN_BYTES:
+        return pyreadstat.read_file_multiprocessing(
+            pyreadstat.read_sav, file_path, num_processes=os.cpu_count()
+        )
+    return pyreadstat.read_sav(file_path)
+
+def read_excel_file(file_path: str) -> pd.DataFrame:
+    """
+    Read the first sheet of an Excel workbook into a DataFrame.
+
+    The workbook is parsed with calamine, which is much faster than openpyxl
+    and also reads legacy .xls files. Workbooks calamine cannot parse are
+    read with openpyxl instead. The first row holds the column names.
+
+    Args:
+        file_path (str): Path to the Excel file.
+
+    Returns:
+        pd.DataFrame: The sheet's data.
+    """
+    try:
+        return _read_excel_calamine(file_path)
+    except Exception:
+        return _read_excel_openpyxl(file_path)
+
+def _read_excel_calamine(file_path: str) -> pd.DataFrame:
+    rows = CalamineWorkbook.from_path(file_path).get_sheet_by_index(0).to_python()
+    if not rows:
+        return pd.DataFrame()
+    # calamine returns empty cells as '' where openpyxl returns None
+    body = [[None if value == '' else value for value in row] for row in rows[1:]]
+    df = pd.DataFrame(body, columns=rows[0])
+    # Give columns the dtypes openpyxl would have produced: Excel stores all
+    # numbers as floats, and calamine returns midnight timestamps as dates
+    for col in df.select_dtypes(include='float').columns:
+        values = df[col]
+        if values.notna().all() and (values % 1 == 0).all():
+            df[col] = values.astype('int64')
+    for col in df.select_dtypes(include='object').columns:
+        if pd.api.types.infer_dtype(df[col], skipna=True) in ('date', 'datetime'):
+            df[col] = pd.to_datetime(df[col])
+    return df
+
+def _read_excel_openpyxl(file_path: str) -> pd.DataFrame:
+    wb = openpyxl.load_workbook(file_path, read_only=True)
+    try:
+        sheet = wb.active
+        # Don't rely on the dimensions declared in the file, which may be
+        # missing or wrong; rows are streamed as stored, sized to the header
+        sheet.reset_dimensions()
+        rows = sheet.iter_rows(values_only=True)
+        columns = list(next(rows, ()))
+        width = len(columns)
+        data = [tuple(row[:width]) + (None,) * (width - len(row)) for row in rows]
+        return pd.DataFrame(data, columns=columns)
+    finally:
+        wb.close()
+
+def iter_df_chunks(file_path: str, file_type: str) -> Iterator[pd.DataFrame]:
+    """
+    Read a CSV or SPSS file as a sequence of DataFrame chunks.
+
+    Chunks keep the row labels they would have in the full file, so indices
+    reported by the cleaning checks still point at the original rows.
+
+    Args:
+        file_path (str): Path to the file.
+        file_type (str): Either 'csv' or 'sav'.
+
+    Yields:
+        pd.DataFrame: Consecutive chunks of the file.
+
+    Raises:
+        ValueError: If the file type cannot be read in chunks.
+    """
+    if file_type == 'csv':
+        yield from pd.read_csv(file_path, chunksize=CSV_CHUNK_SIZE)
+    elif file_type == 'sav':
+        offset = 0
+        for chunk, _ in pyreadstat.read_file_in_chunks(
+            pyreadstat.read_sav, file_path, chunksize=SAV_CHUNK_SIZE
+        ):
+            chunk.index += offset
+            offset += len(chunk)
+            yield chunk
+    else:
+        raise ValueError(f"Chunked reading is not supported for '{file_type}' files.")
+
+def write_arrow_copy(df: pd.DataFrame, file_path: str) -> bool:
+    """
+    Save a parsed upload as an Arrow IPC file next to the original.
+
+    Later reads memory-map this copy instead of parsing the original file
+    again. Data Arrow cannot represent, such as columns of mixed types, is
+    skipped and keeps being read from the original.
+
+    Args:
+        df (pd.DataFrame): The parsed contents of the upload.
+        file_path (str): Path of the stored upload.
+
+    Returns:
+        bool: Whether the copy was written.
+    """
+    arrow_path = file_path + ARROW_COPY_SUFFIX
+    tmp_path = arrow_path + '.tmp'
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        with pa.OSFile(tmp_path, 'wb') as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(tmp_path, arrow_path)
+        return True
+    except Exception as e:
+        logger.warning(f"Could not write Arrow copy of {file_path}: {str(e)}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        return False
+
+def read_uploaded_file(file_path: str, file_type: str) -> pd.DataFrame:
+    """
+    Load a stored upload, preferring its memory-mapped Arrow copy.
+
+    Args:
+        file_path (str): Path of the stored upload.
+        file_type (str): One of 'sav', 'csv' or 'excel'.
+
+    Returns:
+        pd.DataFrame: The file's data.
+    """
+    arrow_path = file_path + ARROW_COPY_SUFFIX
+    if os.path.exists(arrow_path):
+        with pa.memory_map(arrow_path) as source:
+            return pa.ipc.open_file(source).read_all().to_pandas()
+    if file_type == 'sav':
+        df, _ = read_sav_file(file_path)
+        return df
+    if file_type == 'excel':
+        return read_excel_file(file_path)
+    return read_csv_file(file_path)
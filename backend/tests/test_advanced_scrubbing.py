@@ -3,7 +3,7 @@ import pandas as pd
 import numpy as np
 from app.core.advanced_scrubbing import AdvancedScrubbing
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_data():
     return pd.DataFrame({
         'text_response': [
@@ -31,7 +31,7 @@ def sample_data():
         'sentiment2': ['Excellent service', 'Average', 'Terrible', 'Amazing', 'Good']
     })
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def scrubbing():
     return AdvancedScrubbing()
 
@@ -1,13 +1,12 @@
 import pytest
-from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 from datetime import datetime
 
-from main import app
 from backend.models import User
 from backend.security import get_password_hash
 
-client = TestClient(app)
+# bcrypt is deliberately slow; hash the test password once per module
+_TEST_PW_HASH = get_password_hash("testpassword")
 
 @pytest.fixture
 def test_user(db: Session):
@@ -15,7 +14,7 @@ def test_user(db: Session):
     user = User(
         email="test@example.com",
         name="Test User",
-        password=get_password_hash("testpassword"),
+        password=_TEST_PW_HASH,
         role="analyst"
     )
     db.add(user)
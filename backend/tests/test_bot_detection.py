@@ -1,10 +1,9 @@
 import pytest
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
 from app.core.bot_detection import BotDetector
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_data():
     # Create sample survey data
     data = {
@@ -15,24 +14,35 @@ def sample_data():
             'Very brief',
             'A comprehensive analysis of the subject matter.'
         ],
-        'timestamp': [
-            datetime.now() - timedelta(minutes=i)
-            for i in range(5)
-        ],
-        'ip_address': [
+        'timestamp': pd.Timestamp.now() - pd.to_timedelta(np.arange(5), unit='min'),
+        'ip_address': np.array([
             '192.168.1.1',
             '192.168.1.2',
             '192.168.1.1',  # Duplicate IP
             '192.168.1.3',
             '192.168.1.4'
-        ]
+        ], dtype=object)
     }
     return pd.DataFrame(data)
 
 @pytest.fixture
 def detector():
+    # A fresh, untrained detector per test
     return BotDetector()
 
+@pytest.fixture(scope="module")
+def trained_detector(sample_data):
+    # Train once with known bots for the tests that only need a trained model
+    detector = BotDetector()
+    detector.train(
+        sample_data,
+        text_columns=['text_response'],
+        known_bots=[1, 3],
+        time_column='timestamp',
+        ip_column='ip_address'
+    )
+    return detector
+
 def test_feature_extraction(detector, sample_data):
     features = detector.extract_features(
         sample_data,
@@ -46,6 +56,8 @@ def test_feature_extraction(detector, sample_data):
     assert features.shape[1] > 0
 
 def test_bot_detection_training(detector, sample_data):
+    assert not detector.is_trained
+    
     # Train with known bots
     known_bots = [1, 3]  # Indices of known bot responses
     detector.train(
@@ -58,19 +70,9 @@ def test_bot_detection_training(detector, sample_data):
     
     assert detector.is_trained
 
-def test_bot_detection(detector, sample_data):
-    # Train first
-    known_bots = [1, 3]
-    detector.train(
-        sample_data,
-        text_columns=['text_response'],
-        known_bots=known_bots,
-        time_column='timestamp',
-        ip_column='ip_address'
-    )
-    
+def test_bot_detection(trained_detector, sample_data):
     # Test detection
-    results = detector.detect_bots(
+    results = trained_detector.detect_bots(
         sample_data,
         text_columns=['text_response'],
         time_column='timestamp',
@@ -94,45 +96,49 @@ def test_pattern_analysis(detector, sample_data):
     assert 'pattern_details' in results
     assert 'severity' in results
 
-def test_identical_responses(detector):
-    # Create data with identical responses
-    data = pd.DataFrame({
-        'text_response': [
-            'Same response',
-            'Same response',
-            'Same response',
-            'Different response',
-            'Another different response'
-        ],
-        'timestamp': [
-            datetime.now() - timedelta(minutes=i)
-            for i in range(5)
-        ]
-    })
-    
-    results = detector.analyze_patterns(
-        data,
-        text_columns=['text_response'],
-        time_column='timestamp'
+# One input per pattern type, each built to trigger that pattern
+_NOW = pd.Timestamp.now()
+PATTERN_CASES = [
+    (
+        'identical_responses',
+        pd.DataFrame({
+            'text_response': [
+                'Same response',
+                'Same response',
+                'Same response',
+                'Different response',
+                'Another different response'
+            ],
+            'timestamp': _NOW - pd.to_timedelta(np.arange(5), unit='min')
+        })
+    ),
+    (
+        # Offsets of 0.5s and 0.3s are too fast
+        'fast_responses',
+        pd.DataFrame({
+            'text_response': ['Response'] * 5,
+            'timestamp': _NOW + pd.to_timedelta([0, 0.5, 1.5, 0.3, 2.0], unit='s')
+        })
+    ),
+    (
+        'keyboard_patterns',
+        pd.DataFrame({
+            'text_response': [
+                'Normal response',
+                'qwerty asdfgh',
+                'zxcvbn asdfgh',
+                'Another normal response',
+                'qwerty zxcvbn'
+            ],
+            'timestamp': _NOW - pd.to_timedelta(np.arange(5), unit='min')
+        })
     )
-    
-    assert results['patterns_found'] > 0
-    assert any(p['type'] == 'identical_responses' for p in results['pattern_details'])
+]
 
-def test_fast_responses(detector):
-    # Create data with impossibly fast responses
-    now = datetime.now()
-    data = pd.DataFrame({
-        'text_response': ['Response'] * 5,
-        'timestamp': [
-            now,
-            now + timedelta(seconds=0.5),  # Too fast
-            now + timedelta(seconds=1.5),
-            now + timedelta(seconds=0.3),  # Too fast
-            now + timedelta(seconds=2.0)
-        ]
-    })
-    
+@pytest.mark.parametrize(
+    "expected_type,data", PATTERN_CASES, ids=[name for name, _ in PATTERN_CASES]
+)
+def test_pattern_detection(detector, expected_type, data):
     results = detector.analyze_patterns(
         data,
         text_columns=['text_response'],
@@ -140,29 +146,18 @@ def test_fast_responses(detector):
     )
     
     assert results['patterns_found'] > 0
-    assert any(p['type'] == 'fast_responses' for p in results['pattern_details'])
+    assert any(p['type'] == expected_type for p in results['pattern_details'])
 
-def test_keyboard_patterns(detector):
-    # Create data with keyboard patterns
+def test_parallel_pattern_analysis(detector, monkeypatch):
+    # Scanning columns in worker processes must give the same results
     data = pd.DataFrame({
-        'text_response': [
-            'Normal response',
-            'qwerty asdfgh',
-            'zxcvbn asdfgh',
-            'Another normal response',
-            'qwerty zxcvbn'
-        ],
-        'timestamp': [
-            datetime.now() - timedelta(minutes=i)
-            for i in range(5)
-        ]
+        'first': ['qwerty', 'same same answer', 'qwerty', 'fine'],
+        'second': ['ok', 'ok', 'zxcvbn here', 'word word']
     })
+    serial = detector.analyze_patterns(data, text_columns=['first', 'second'])
     
-    results = detector.analyze_patterns(
-        data,
-        text_columns=['text_response'],
-        time_column='timestamp'
-    )
+    monkeypatch.setattr('app.core.bot_detection.PARALLEL_PATTERN_MIN_CELLS', 0)
+    parallel = detector.analyze_patterns(data, text_columns=['first', 'second'])
     
-    assert results['patterns_found'] > 0
-    assert any(p['type'] == 'keyboard_patterns' for p in results['pattern_details']) 
\ No newline at end of file
+    assert parallel == serial
+    assert parallel['patterns_found'] > 0
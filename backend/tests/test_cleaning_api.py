@@ -1,109 +1,103 @@
 import pytest
-from fastapi.testclient import TestClient
-from sqlalchemy.orm import Session
 import pandas as pd
 import numpy as np
-from datetime import datetime
-import os
-import tempfile
-
-from ..main import app
-from ..database import get_db
-from ..models import User, Project, DataFile, CleaningCheck, CleaningResult
-from ..auth import create_access_token
-
-client = TestClient(app)
-
-@pytest.fixture
-def test_db():
-    """Create a test database session."""
-    from ..database import Base, engine
-    Base.metadata.create_all(bind=engine)
-    db = Session(engine)
-    yield db
-    db.close()
-    Base.metadata.drop_all(bind=engine)
-
-@pytest.fixture
+from datetime import timedelta
+from uuid import uuid4
+from pydantic import ValidationError
+
+from backend.models import User, DataFile, CleaningCheck, CleaningResult
+from backend.security import create_access_token
+from backend.services import file_loader
+from backend.routes.cleaning import (
+    CleaningRequest, _request_frame, _save_cleaning_results, _CLEANING_ENGINE
+)
+
+# The file is cleaned once through the API and every test reads the same
+# results, so the fixtures below share one module-wide transaction
+
+@pytest.fixture(scope="module")
+def test_db(module_db):
+    """Test database session; its changes are rolled back after the module."""
+    return module_db
+
+@pytest.fixture(scope="module")
 def test_user(test_db):
     """Create a test user."""
     user = User(
         email="test@example.com",
-        hashed_password="hashed_password",
+        name="Test User",
+        role="analyst",
         is_active=True
     )
     test_db.add(user)
     test_db.commit()
     return user
 
-@pytest.fixture
-def test_project(test_db, test_user):
-    """Create a test project."""
-    project = Project(
-        name="Test Project",
-        user_id=test_user.id
+@pytest.fixture(scope="module")
+def uploads_dir(tmp_path_factory):
+    """Point the stored uploads at a temporary directory."""
+    path = tmp_path_factory.mktemp("uploads")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(file_loader, "UPLOADS_DIR", str(path))
+        yield path
+
+@pytest.fixture(scope="module")
+def test_data_file(test_db, uploads_dir):
+    """Store a CSV upload and register it."""
+    df = pd.DataFrame({
+        'numeric_col': [1, 2, 3, 100, 5, 6, 7, 8, 9, 10],
+        'categorical_col': ['A', 'B', 'A', 'C', 'B', 'A', 'B', 'C', 'A', 'B'],
+        'text_col': [
+            'Good response',
+            'Bad response',
+            'Test',
+            'asdf',
+            'Nice answer',
+            'qwer',
+            'Detailed response',
+            '123',
+            'Helpful comment',
+            'none'
+        ]
+    })
+    path = uploads_dir / "test.csv"
+    df.to_csv(path, index=False)
+    
+    data_file = DataFile(
+        original_filename="test.csv",
+        file_size=path.stat().st_size,
+        file_type="csv",
+        upload_status="completed"
     )
-    test_db.add(project)
+    test_db.add(data_file)
     test_db.commit()
-    return project
-
-@pytest.fixture
-def test_data_file(test_db, test_project):
-    """Create a test data file."""
-    # Create a temporary CSV file
-    with tempfile.NamedTemporaryFile(suffix='.csv', delete=False) as temp_file:
-        df = pd.DataFrame({
-            'numeric_col': [1, 2, 3, 100, 5, 6, 7, 8, 9, 10],
-            'categorical_col': ['A', 'B', 'A', 'C', 'B', 'A', 'B', 'C', 'A', 'B'],
-            'text_col': [
-                'Good response',
-                'Bad response',
-                'Test',
-                'asdf',
-                'Nice answer',
-                'qwer',
-                'Detailed response',
-                '123',
-                'Helpful comment',
-                'none'
-            ]
-        })
-        df.to_csv(temp_file.name, index=False)
-        
-        data_file = DataFile(
-            project_id=test_project.id,
-            original_filename="test.csv",
-            file_path=temp_file.name,
-            file_size=os.path.getsize(temp_file.name),
-            file_type="csv",
-            upload_status="completed"
-        )
-        test_db.add(data_file)
-        test_db.commit()
-        
-        return data_file
-
-@pytest.fixture
+    
+    return data_file
+
+@pytest.fixture(scope="module")
 def auth_headers(test_user):
     """Create authentication headers."""
-    access_token = create_access_token(data={"sub": test_user.email})
-    return {"Authorization": f"Bearer {access_token}"}
+    token = create_access_token(data={"sub": test_user.email}, expires_delta=timedelta(days=1))
+    return {"Authorization": f"Bearer {token}"}
 
-def test_clean_data_file(test_db, test_data_file, auth_headers):
-    """Test cleaning a data file."""
-    response = client.post(
-        f"/cleaning/{test_data_file.id}/clean",
+@pytest.fixture(scope="module")
+def cleaned_file(client, test_data_file, auth_headers):
+    """Clean the test data file once and return the response."""
+    return client.post(
+        f"/api/v1/cleaning/{test_data_file.id}/clean",
         headers=auth_headers,
         json={
-            "config": {
-                "required_fields": ["numeric_col", "categorical_col"],
-                "expected_types": {
-                    "numeric_col": "int64",
-                    "categorical_col": "object"
-                }
+            "required_fields": ["numeric_col", "categorical_col"],
+            "expected_types": {
+                "numeric_col": "int64",
+                "categorical_col": "object"
             }
         }
     )
+
+def test_clean_data_file(test_db, test_data_file, cleaned_file):
+    """Test cleaning a data file."""
+    response = cleaned_file
     
     assert response.status_code == 200
     data = response.json()
@@ -115,20 +109,33 @@ def test_clean_data_file(test_db, test_data_file, auth_headers):
     results = test_db.query(CleaningResult).filter(
         CleaningResult.data_file_id == test_data_file.id
     ).all()
-    assert len(results) > 0
+    assert len(results) == len(data["results"]["detailed_results"])
 
-def test_get_cleaning_results(test_db, test_data_file, auth_headers):
-    """Test getting cleaning results."""
-    # First run cleaning
-    client.post(
-        f"/cleaning/{test_data_file.id}/clean",
-        headers=auth_headers,
-        json={}
-    )
+def test_save_cleaning_results(test_db):
+    """Test storing the report of a cleaning run."""
+    data_file = DataFile(original_filename="other.csv", file_type="csv", upload_status="completed")
+    test_db.add(data_file)
+    test_db.flush()
+    report = _CLEANING_ENGINE.process_data(pd.DataFrame({
+        'numeric_col': [1, 2, None, 100],
+        'text_col': ['Good response', 'ok', 'aaaaaa', 'Fine']
+    }))
     
-    # Then get results
+    _save_cleaning_results(test_db, _CLEANING_ENGINE, data_file, report)
+    
+    saved = test_db.query(CleaningCheck.name, CleaningResult).join(CleaningResult.check).filter(
+        CleaningResult.data_file_id == data_file.id
+    ).all()
+    assert {name for name, _ in saved} == set(report['detailed_results'])
+    for name, result in saved:
+        assert result.project_id is None
+        assert result.issues_found == report['detailed_results'][name]['issues_found']
+
+def test_get_cleaning_results(client, test_data_file, auth_headers, cleaned_file):
+    """Test getting cleaning results."""
+    # Results of the cleaning run by the cleaned_file fixture
     response = client.get(
-        f"/cleaning/{test_data_file.id}/results",
+        f"/api/v1/cleaning/{test_data_file.id}/results",
         headers=auth_headers
     )
     
@@ -138,10 +145,10 @@ def test_get_cleaning_results(test_db, test_data_file, auth_headers):
     assert "results" in data
     assert len(data["results"]) > 0
 
-def test_clean_nonexistent_file(test_db, auth_headers):
+def test_clean_nonexistent_file(client, auth_headers):
     """Test cleaning a nonexistent file."""
     response = client.post(
-        "/cleaning/nonexistent-id/clean",
+        f"/api/v1/cleaning/{uuid4()}/clean",
         headers=auth_headers,
         json={}
     )
@@ -149,29 +156,49 @@ def test_clean_nonexistent_file(test_db, auth_headers):
     assert response.status_code == 404
     assert response.json()["detail"] == "Data file not found"
 
-def test_get_results_nonexistent_file(test_db, auth_headers):
+def test_get_results_nonexistent_file(client, auth_headers):
     """Test getting results for a nonexistent file."""
     response = client.get(
-        "/cleaning/nonexistent-id/results",
+        f"/api/v1/cleaning/{uuid4()}/results",
         headers=auth_headers
     )
     
     assert response.status_code == 404
     assert response.json()["detail"] == "Data file not found"
 
-def test_clean_file_unauthorized(test_db, test_data_file):
+def test_clean_file_unauthorized(client, test_data_file):
     """Test cleaning a file without authentication."""
     response = client.post(
-        f"/cleaning/{test_data_file.id}/clean",
+        f"/api/v1/cleaning/{test_data_file.id}/clean",
         json={}
     )
     
     assert response.status_code == 401
 
-def test_get_results_unauthorized(test_db, test_data_file):
+def test_get_results_unauthorized(client, test_data_file):
     """Test getting results without authentication."""
     response = client.get(
-        f"/cleaning/{test_data_file.id}/results"
+        f"/api/v1/cleaning/{test_data_file.id}/results"
     )
     
-    assert response.status_code == 401 
\ No newline at end of file
+    assert response.status_code == 401
+
+def test_request_frame_with_dtypes():
+    """Test building typed columns from a DataFrame.to_dict() payload."""
+    df = pd.DataFrame({'score': [1.5, None, 3.0], 'comment': ['good', 'bad', 'ok']})
+    request = CleaningRequest(data=df.to_dict(), dtypes={'score': 'float64'})
+    
+    frame = _request_frame(request)
+    
+    assert frame['score'].dtype == np.float64
+    assert frame['score'].isna().tolist() == [False, True, False]
+    assert frame['comment'].tolist() == ['good', 'bad', 'ok']
+
+@pytest.mark.parametrize("dtypes", [
+    {'unknown_col': 'int64'},
+    {'score': 'not_a_dtype'}
+])
+def test_request_invalid_dtypes(dtypes):
+    """Test that dtypes for unknown columns or with bad names are rejected."""
+    with pytest.raises(ValidationError):
+        CleaningRequest(data={'score': [1.5, 2.0]}, dtypes=dtypes)
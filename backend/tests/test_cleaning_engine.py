@@ -4,7 +4,7 @@ import numpy as np
 from datetime import datetime, timedelta
 from cleaning_engine import CleaningEngine, CheckSeverity, CheckResult
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_data():
     """Create sample data for testing."""
     data = {
@@ -31,6 +31,16 @@ def sample_data():
     return pd.DataFrame(data)
 
 @pytest.fixture
+def sample_data_mut(sample_data):
+    """Copy of the sample data for tests that modify it."""
+    return sample_data.copy()
+
+@pytest.fixture(scope="module")
+def sample_data_with_dup(sample_data):
+    """Sample data with its first row repeated at the end."""
+    return pd.concat([sample_data, sample_data.iloc[0:1]], ignore_index=True)
+
+@pytest.fixture(scope="module")
 def cleaning_engine():
     """Create a CleaningEngine instance with test configuration."""
     config = {
@@ -55,186 +65,182 @@ def cleaning_engine():
     }
     return CleaningEngine(config)
 
-def test_missing_values_check(cleaning_engine, sample_data):
+@pytest.fixture(scope="module")
+def full_results(cleaning_engine, sample_data):
+    """Run every check once over the sample data."""
+    return cleaning_engine.process_data(sample_data)
+
+# Checks asserted on one shared run over the unmodified sample data, with a
+# condition their issues must meet
+SAMPLE_DATA_CHECKS = [
+    ('outliers', lambda issues: any(issue['column'] == 'numeric_col' for issue in issues)),
+    ('numeric_range', lambda issues: any(issue['column'] == 'numeric_col' for issue in issues)),
+    ('text_quality', lambda issues: any(issue['issue_type'] == 'short_texts' for issue in issues)),
+    ('consistency', lambda issues: any(issue['rule'] == 'numeric_range' for issue in issues)),
+    ('speeders', lambda issues: 'speeder_count' in issues[0]),
+    ('logical_consistency', lambda issues: any(issue['rule'] == 'numeric_range' for issue in issues)),
+    ('text_sentiment', lambda issues: any(issue['column'] == 'text_col' for issue in issues)),
+    ('response_time', lambda issues: 'long_response_count' in issues[0]),
+    ('data_type', lambda issues: any(issue['column'] == 'numeric_col' for issue in issues)),
+    ('value_distribution', lambda issues: any(issue['column'] == 'numeric_col' for issue in issues)),
+    ('cross_validation', lambda issues: any(issue['rule'] == 'numeric_range' for issue in issues)),
+    ('format_consistency', lambda issues: any(issue['column'] == 'text_col' for issue in issues)),
+]
+
+def test_missing_values_check(cleaning_engine, sample_data_mut):
     """Test missing values check."""
     # Add some missing values
-    sample_data.loc[0, 'numeric_col'] = np.nan
-    sample_data.loc[1, 'categorical_col'] = np.nan
+    sample_data_mut.loc[0, 'numeric_col'] = np.nan
+    sample_data_mut.loc[1, 'categorical_col'] = np.nan
     
-    results = cleaning_engine._check_missing_values(sample_data)
+    results = cleaning_engine._check_missing_values(sample_data_mut)
     
     assert results['issues']
     assert len(results['issues']) == 2
     assert results['summary']['total_columns_with_missing'] == 2
 
-def test_duplicates_check(cleaning_engine, sample_data):
+def test_duplicates_check(cleaning_engine, sample_data_with_dup):
     """Test duplicates check."""
-    # Add a duplicate row
-    sample_data = pd.concat([sample_data, sample_data.iloc[0:1]])
-    
-    results = cleaning_engine._check_duplicates(sample_data)
+    results = cleaning_engine._check_duplicates(sample_data_with_dup)
     
     assert results['issues']
     assert results['summary']['total_duplicates'] == 1
 
-def test_outliers_check(cleaning_engine, sample_data):
-    """Test outliers detection."""
-    results = cleaning_engine._check_outliers(sample_data)
-    
-    assert results['issues']
-    assert any(issue['column'] == 'numeric_col' for issue in results['issues'])
+@pytest.mark.parametrize(
+    "check_name,condition", SAMPLE_DATA_CHECKS, ids=[name for name, _ in SAMPLE_DATA_CHECKS]
+)
+def test_sample_data_check(full_results, check_name, condition):
+    """Test a check's issues on the unmodified sample data."""
+    result = full_results['detailed_results'][check_name]
+    
+    assert result['status'] == 'completed'
+    issues = result['details']['issues']
+    assert issues
+    assert condition(issues)
 
-def test_inconsistent_categories_check(cleaning_engine, sample_data):
+def test_inconsistent_categories_check(cleaning_engine, sample_data_mut):
     """Test inconsistent categories check."""
     # Add a rare category
-    sample_data.loc[0, 'categorical_col'] = 'Z'
+    sample_data_mut.loc[0, 'categorical_col'] = 'Z'
     
-    results = cleaning_engine._check_inconsistent_categories(sample_data)
+    results = cleaning_engine._check_inconsistent_categories(sample_data_mut)
     
     assert results['issues']
     assert any(issue['column'] == 'categorical_col' for issue in results['issues'])
 
-def test_date_anomalies_check(cleaning_engine, sample_data):
+def test_date_anomalies_check(cleaning_engine, sample_data_mut):
     """Test date anomalies check."""
     # Add a future date
-    sample_data.loc[0, 'date_col'] = datetime.now() + timedelta(days=1)
+    sample_data_mut.loc[0, 'date_col'] = datetime.now() + timedelta(days=1)
     
-    results = cleaning_engine._check_date_anomalies(sample_data)
+    results = cleaning_engine._check_date_anomalies(sample_data_mut)
     
     assert results['issues']
     assert any(issue['issue_type'] == 'future_dates' for issue in results['issues'])
 
-def test_numeric_range_check(cleaning_engine, sample_data):
-    """Test numeric range check."""
-    results = cleaning_engine._check_numeric_range(sample_data)
-    
-    assert results['issues']
-    assert any(issue['column'] == 'numeric_col' for issue in results['issues'])
-
-def test_text_quality_check(cleaning_engine, sample_data):
-    """Test text quality check."""
-    results = cleaning_engine._check_text_quality(sample_data)
-    
-    assert results['issues']
-    assert any(issue['issue_type'] == 'short_texts' for issue in results['issues'])
 
-def test_response_patterns_check(cleaning_engine, sample_data):
+def test_response_patterns_check(cleaning_engine, sample_data_mut):
     """Test response patterns check."""
     # Add an alternating pattern
-    sample_data['pattern_col'] = [1, 2, 1, 2, 1, 2, 1, 2, 1, 2]
+    sample_data_mut['pattern_col'] = [1, 2, 1, 2, 1, 2, 1, 2, 1, 2]
     
-    results = cleaning_engine._check_response_patterns(sample_data)
+    results = cleaning_engine._check_response_patterns(sample_data_mut)
     
     assert results['issues']
     assert any(issue['issue_type'] == 'alternating_pattern' for issue in results['issues'])
 
-def test_completeness_check(cleaning_engine, sample_data):
+def test_completeness_check(cleaning_engine, sample_data_mut):
     """Test completeness check."""
     # Add missing values to required fields
-    sample_data.loc[0, 'numeric_col'] = np.nan
-    sample_data.loc[1, 'categorical_col'] = np.nan
+    sample_data_mut.loc[0, 'numeric_col'] = np.nan
+    sample_data_mut.loc[1, 'categorical_col'] = np.nan
     
-    results = cleaning_engine._check_completeness(sample_data)
+    results = cleaning_engine._check_completeness(sample_data_mut)
     
     assert results['issues']
     assert len(results['issues']) == 2
 
-def test_consistency_check(cleaning_engine, sample_data):
-    """Test consistency check."""
-    results = cleaning_engine._check_consistency(sample_data)
-    
-    assert results['issues']
-    assert any(issue['rule'] == 'numeric_range' for issue in results['issues'])
 
-def test_speeders_check(cleaning_engine, sample_data):
-    """Test speeders check."""
-    results = cleaning_engine._check_speeders(sample_data)
-    
-    assert results['issues']
-    assert 'speeder_count' in results['issues'][0]
-
-def test_straightliners_check(cleaning_engine, sample_data):
+def test_straightliners_check(cleaning_engine, sample_data_mut):
     """Test straightliners check."""
     # Add a straight-lining pattern
-    sample_data['straight_col'] = [1, 1, 1, 1, 1, 1, 1, 1, 1, 1]
+    sample_data_mut['straight_col'] = [1, 1, 1, 1, 1, 1, 1, 1, 1, 1]
     
-    results = cleaning_engine._check_straightliners(sample_data)
+    results = cleaning_engine._check_straightliners(sample_data_mut)
     
     assert results['issues']
     assert results['summary']['straightliner_count'] > 0
 
-def test_logical_consistency_check(cleaning_engine, sample_data):
-    """Test logical consistency check."""
-    results = cleaning_engine._check_logical_consistency(sample_data)
-    
-    assert results['issues']
-    assert any(issue['rule'] == 'numeric_range' for issue in results['issues'])
 
-def test_text_sentiment_check(cleaning_engine, sample_data):
-    """Test text sentiment check."""
-    results = cleaning_engine._check_text_sentiment(sample_data)
-    
-    assert results['issues']
-    assert any(issue['column'] == 'text_col' for issue in results['issues'])
 
-def test_response_time_check(cleaning_engine, sample_data):
-    """Test response time check."""
-    results = cleaning_engine._check_response_time(sample_data)
-    
-    assert results['issues']
-    assert 'long_response_count' in results['issues'][0]
 
-def test_data_type_check(cleaning_engine, sample_data):
-    """Test data type check."""
-    results = cleaning_engine._check_data_type(sample_data)
-    
-    assert results['issues']
-    assert any(issue['column'] == 'numeric_col' for issue in results['issues'])
 
-def test_value_distribution_check(cleaning_engine, sample_data):
-    """Test value distribution check."""
-    results = cleaning_engine._check_value_distribution(sample_data)
-    
-    assert results['issues']
-    assert any(issue['column'] == 'numeric_col' for issue in results['issues'])
-
-def test_cross_validation_check(cleaning_engine, sample_data):
-    """Test cross validation check."""
-    results = cleaning_engine._check_cross_validation(sample_data)
-    
-    assert results['issues']
-    assert any(issue['rule'] == 'numeric_range' for issue in results['issues'])
-
-def test_format_consistency_check(cleaning_engine, sample_data):
-    """Test format consistency check."""
-    results = cleaning_engine._check_format_consistency(sample_data)
-    
-    assert results['issues']
-    assert any(issue['column'] == 'text_col' for issue in results['issues'])
-
-def test_completeness_by_section_check(cleaning_engine, sample_data):
+def test_completeness_by_section_check(cleaning_engine, sample_data_mut):
     """Test completeness by section check."""
     # Add missing values to section fields
-    sample_data.loc[0, 'numeric_col'] = np.nan
-    sample_data.loc[1, 'categorical_col'] = np.nan
+    sample_data_mut.loc[0, 'numeric_col'] = np.nan
+    sample_data_mut.loc[1, 'categorical_col'] = np.nan
     
-    results = cleaning_engine._check_completeness_by_section(sample_data)
+    results = cleaning_engine._check_completeness_by_section(sample_data_mut)
     
     assert results['issues']
     assert any(issue['section'] == 'demographics' for issue in results['issues'])
 
-def test_process_data(cleaning_engine, sample_data):
+def test_process_data(cleaning_engine, full_results):
     """Test the main process_data method."""
-    results = cleaning_engine.process_data(sample_data)
+    results = full_results
     
     assert isinstance(results, dict)
     assert all(check in results for check in cleaning_engine.checks.keys())
     assert all('status' in result for result in results.values())
     assert all('issues_found' in result for result in results.values())
 
-def test_performance_monitoring(cleaning_engine, sample_data):
+def test_process_chunks(cleaning_engine, sample_data):
+    """Test processing data in chunks and merging the partial results."""
+    chunks = [sample_data.iloc[:5], sample_data.iloc[5:]]
+    
+    results = cleaning_engine.process_chunks(chunks)
+    detailed = results['detailed_results']
+    
+    assert len(detailed) == len(cleaning_engine.checks)
+    assert results['summary']['total_checks'] == len(cleaning_engine.checks)
+    
+    # A column flagged in both chunks is reported and counted once, with
+    # its counts and row indices added up
+    whole = cleaning_engine.process_data(sample_data)['detailed_results']
+    text_quality = detailed['text_quality']
+    assert text_quality['details'] == whole['text_quality']['details']
+    assert text_quality['issues_found'] == whole['text_quality']['issues_found'] == 1
+    issue = text_quality['details']['issues'][0]
+    assert issue['count'] == len(issue['indices']) == len(sample_data)
+    
+    for result in detailed.values():
+        if result['status'] == 'completed':
+            assert result['issues_found'] == len(result['details']['issues'])
+
+def test_process_chunks_recomputes_percentages(cleaning_engine, sample_data_mut):
+    """Test that merged percentages are relative to the whole dataset."""
+    sample_data_mut.loc[[0, 6], 'numeric_col'] = np.nan
+    chunks = [sample_data_mut.iloc[:5], sample_data_mut.iloc[5:]]
+    
+    detailed = cleaning_engine.process_chunks(chunks)['detailed_results']
+    missing = detailed['missing_values']['details']
+    
+    assert missing['issues'] == [
+        {'column': 'numeric_col', 'missing_count': 2, 'missing_percentage': 20.0}
+    ]
+    assert missing['summary'] == {
+        'total_columns_with_missing': 1,
+        'max_missing_percentage': 20.0
+    }
+    assert detailed['missing_values']['issues_found'] == 1
+    
+    whole = cleaning_engine.process_data(sample_data_mut)['detailed_results']
+    assert detailed['missing_values']['details'] == whole['missing_values']['details']
+
+def test_performance_monitoring(full_results):
     """Test performance monitoring functionality."""
-    results = cleaning_engine.process_data(sample_data)
+    results = full_results
     
     assert 'summary' in results
     assert 'execution_time' in results['summary']
@@ -242,9 +248,9 @@ def test_performance_monitoring(cleaning_engine, sample_data):
     assert isinstance(results['summary']['execution_time'], float)
     assert isinstance(results['summary']['check_performance'], dict)
 
-def test_summary_report_generation(cleaning_engine, sample_data):
+def test_summary_report_generation(full_results):
     """Test summary report generation."""
-    results = cleaning_engine.process_data(sample_data)
+    results = full_results
     
     assert 'summary' in results
     assert 'total_checks' in results['summary']
@@ -285,13 +291,13 @@ def test_parallel_processing(cleaning_engine, sample_data):
     execution_time = (end_time - start_time).total_seconds()
     assert execution_time < sum(results['summary']['check_performance'].values())
 
-def test_error_handling(cleaning_engine, sample_data):
+def test_error_handling(cleaning_engine, sample_data, monkeypatch):
     """Test error handling in checks."""
-    # Modify a check to force an error
+    # Modify a check to force an error; the engine is shared, so restore it
     def failing_check(data):
         raise ValueError("Test error")
     
-    cleaning_engine.checks['missing_values']['function'] = failing_check
+    monkeypatch.setitem(cleaning_engine.checks['missing_values'], 'function', failing_check)
     
     results = cleaning_engine.process_data(sample_data)
     
@@ -300,9 +306,9 @@ def test_error_handling(cleaning_engine, sample_data):
     assert 'error' in results['detailed_results']['missing_values']
     assert results['summary']['failed_checks'] > 0
 
-def test_severity_levels(cleaning_engine, sample_data):
+def test_severity_levels(cleaning_engine, full_results):
     """Test severity level assignment and reporting."""
-    results = cleaning_engine.process_data(sample_data)
+    results = full_results
     
     # Verify severity distribution
     severity_dist = results['summary']['severity_distribution']
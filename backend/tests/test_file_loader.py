@@ -0,0 +1,79 @@
+import os
+import pytest
+import pandas as pd
+import numpy as np
+
+from backend.services.file_loader import (
+    read_csv_file, read_excel_file, read_uploaded_file, write_arrow_copy
+)
+
+@pytest.fixture
+def csv_path(tmp_path):
+    """Write a small CSV file for testing."""
+    path = tmp_path / "sample.csv"
+    path.write_text(
+        "id,score,comment\n"
+        "1,4.5,good\n"
+        "2,,\n"
+        "3,3.0,ok\n"
+    )
+    return str(path)
+
+def test_read_csv_file(csv_path):
+    """Test reading a CSV file into a DataFrame."""
+    df = read_csv_file(csv_path)
+    
+    assert list(df.columns) == ['id', 'score', 'comment']
+    assert len(df) == 3
+    assert pd.api.types.is_integer_dtype(df['id'])
+    assert pd.api.types.is_float_dtype(df['score'])
+
+def test_read_csv_file_empty_fields_are_missing(csv_path):
+    """Test that empty fields are read as missing values."""
+    df = read_csv_file(csv_path)
+    
+    assert np.isnan(df['score'][1])
+    assert df['comment'].isna().tolist() == [False, True, False]
+
+def test_read_csv_file_keeps_dates_as_strings(tmp_path):
+    """Test that date and time columns are read as text, as pandas does."""
+    path = tmp_path / "dates.csv"
+    path.write_text(
+        "id,submitted,started_at\n"
+        "1,2024-01-01,2024-01-01T09:30\n"
+        "2,,2024-01-02 10:00:00\n"
+    )
+    df = read_csv_file(str(path))
+    expected = pd.read_csv(str(path))
+    
+    assert df['submitted'].tolist()[0] == '2024-01-01'
+    assert df['started_at'].tolist() == ['2024-01-01T09:30', '2024-01-02 10:00:00']
+    assert df['submitted'].isna().tolist() == [False, True]
+    assert df.dtypes.to_dict() == expected.dtypes.to_dict()
+    
+    assert write_arrow_copy(df, str(path))
+    copy = read_uploaded_file(str(path), 'csv')
+    assert copy['started_at'].tolist() == df['started_at'].tolist()
+    assert copy.dtypes.to_dict() == expected.dtypes.to_dict()
+
+
+def test_read_excel_file(tmp_path):
+    """Test reading the active sheet of an Excel file."""
+    path = tmp_path / "sample.xlsx"
+    pd.DataFrame({'id': [1, 2, 3], 'comment': ['good', None, 'ok']}).to_excel(path, index=False)
+    
+    df = read_excel_file(str(path))
+    
+    assert list(df.columns) == ['id', 'comment']
+    assert df['id'].tolist() == [1, 2, 3]
+    assert df['comment'].isna().tolist() == [False, True, False]
+
+
+def test_read_uploaded_file_uses_arrow_copy(csv_path):
+    """Test that a stored upload is read back from its Arrow copy."""
+    df = read_csv_file(csv_path)
+    
+    assert write_arrow_copy(df, csv_path)
+    # The Arrow copy is read even once the original is gone
+    os.remove(csv_path)
+    pd.testing.assert_frame_equal(read_uploaded_file(csv_path, 'csv'), df)
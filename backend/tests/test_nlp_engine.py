@@ -1,9 +1,57 @@
+import os
+import re
+import threading
 import pytest
+import spacy
+from app.core import nlp_engine as nlp_engine_module
 from app.core.nlp_engine import NLEngine
 
-@pytest.fixture
+# Set FULL_NLP=1 to run against the real transformer and spaCy models
+FULL_NLP = os.getenv('FULL_NLP') == '1'
+
+# Loading the real models takes a while; start it in the background when the
+# module is collected so it overlaps with collecting the rest of the suite.
+# The nlp_engine fixture joins the thread and re-raises anything it raised.
+_preloaded = {}
+
+def _preload_engine():
+    try:
+        _preloaded['engine'] = NLEngine()
+    except BaseException as e:
+        _preloaded['error'] = e
+
+_preload_thread = threading.Thread(target=_preload_engine, name='nlp-engine-preload', daemon=True)
+if FULL_NLP:
+    _preload_thread.start()
+
+def _stub_sentiment(texts, **kwargs):
+    return [{'label': 'POSITIVE', 'score': 0.9} for _ in texts]
+
+def _stub_zero_shot(texts, candidate_labels, multi_label=False, **kwargs):
+    scores = [1.0 / len(candidate_labels)] * len(candidate_labels)
+    return [
+        {'sequence': text, 'labels': list(candidate_labels), 'scores': scores}
+        for text in texts
+    ]
+
+_STUB_PIPELINES = {
+    'sentiment-analysis': _stub_sentiment,
+    'zero-shot-classification': _stub_zero_shot
+}
+
+@pytest.fixture(scope="session")
 def nlp_engine():
-    return NLEngine()
+    if FULL_NLP:
+        _preload_thread.join()
+        if 'error' in _preloaded:
+            raise RuntimeError("Loading the NLP models failed") from _preloaded['error']
+        return _preloaded['engine']
+    # Skip downloading and loading the models; these tests check the shape
+    # of the engine's results, not the models' predictions
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(nlp_engine_module, 'pipeline', lambda task, *args, **kwargs: _STUB_PIPELINES[task])
+        mp.setattr(nlp_engine_module.spacy, 'load', lambda name: spacy.blank('en'))
+        return NLEngine()
 
 def test_sentiment_analysis(nlp_engine):
     texts = [
@@ -74,18 +122,20 @@ def test_entity_extraction(nlp_engine):
     assert 'entity_statistics' in results
     assert len(results['results']) == len(texts)
 
+# Compiled once; extract_entities uses compiled patterns as given
+CUSTOM_PATTERNS = {
+    'currency': re.compile(r'\$\d+(?:\.\d{2})?', re.IGNORECASE),
+    'time': re.compile(r'\d{1,2}:\d{2}\s*(?:AM|PM|am|pm)?', re.IGNORECASE)
+}
+
 def test_custom_entity_patterns(nlp_engine):
     texts = [
         'I bought a product for $99.99 on 12/25/2023.',
         'The service was excellent at 2:30 PM.',
         'I need help with my order.'
     ]
-    custom_patterns = {
-        'currency': r'\$\d+(?:\.\d{2})?',
-        'time': r'\d{1,2}:\d{2}\s*(?:AM|PM|am|pm)?'
-    }
     
-    results = nlp_engine.extract_entities(texts, custom_patterns)
+    results = nlp_engine.extract_entities(texts, CUSTOM_PATTERNS)
     
     assert 'total_texts' in results
     assert 'results' in results
@@ -94,45 +144,49 @@ def test_custom_entity_patterns(nlp_engine):
     assert 'currency' in results['entity_statistics']['custom']
     assert 'time' in results['entity_statistics']['custom']
 
-def test_text_quality_analysis(nlp_engine):
-    texts = [
-        'This is a simple text.',
-        'This is a more complex text with multiple sentences. It has more words and better structure.',
-        'VERY SHORT TEXT!'
-    ]
-    
-    results = nlp_engine.analyze_text_quality(texts)
+QUALITY_TEXTS = [
+    'This is a simple text.',
+    'This is a more complex text with multiple sentences. It has more words and better structure.',
+    'VERY SHORT TEXT!'
+]
+
+READABILITY_TEXTS = [
+    'The cat sat on the mat.',  # Very easy
+    'The quick brown fox jumps over the lazy dog.',  # Easy
+    'The implementation of the algorithm requires careful consideration of edge cases.',  # Moderate
+    'The quantum mechanical properties of subatomic particles exhibit wave-particle duality.',  # Difficult
+    'The phenomenological hermeneutics of existential ontology necessitates a deconstruction of metaphysical presuppositions.'  # Very difficult
+]
+
+@pytest.fixture(scope="module")
+def quality_results(nlp_engine):
+    # Analyze both corpora in one pass; each test checks its own slice
+    return nlp_engine.analyze_text_quality(QUALITY_TEXTS + READABILITY_TEXTS)
+
+def test_text_quality_analysis(quality_results):
+    results = quality_results
     
     assert 'total_texts' in results
     assert 'results' in results
     assert 'aggregate_metrics' in results
-    assert len(results['results']) == len(texts)
+    assert len(results['results']) == len(QUALITY_TEXTS) + len(READABILITY_TEXTS)
     
     # Check metrics
-    for result in results['results']:
+    for result in results['results'][:len(QUALITY_TEXTS)]:
         assert 'metrics' in result
         assert 'word_count' in result['metrics']
         assert 'sentence_count' in result['metrics']
         assert 'readability_score' in result['metrics']
         assert 'readability_level' in result['metrics']
 
-def test_readability_levels(nlp_engine):
-    # Test different readability levels
-    texts = [
-        'The cat sat on the mat.',  # Very easy
-        'The quick brown fox jumps over the lazy dog.',  # Easy
-        'The implementation of the algorithm requires careful consideration of edge cases.',  # Moderate
-        'The quantum mechanical properties of subatomic particles exhibit wave-particle duality.',  # Difficult
-        'The phenomenological hermeneutics of existential ontology necessitates a deconstruction of metaphysical presuppositions.'  # Very difficult
-    ]
-    
-    results = nlp_engine.analyze_text_quality(texts)
+def test_readability_levels(quality_results):
+    results = quality_results
     
-    assert 'total_texts' in results
-    assert 'results' in results
-    assert 'aggregate_metrics' in results
     assert 'readability_distribution' in results['aggregate_metrics']
     
     # Check that we have different readability levels
-    levels = set(r['metrics']['readability_level'] for r in results['results'])
-    assert len(levels) > 1 
\ No newline at end of file
+    levels = set(
+        r['metrics']['readability_level']
+        for r in results['results'][len(QUALITY_TEXTS):]
+    )
+    assert len(levels) > 1
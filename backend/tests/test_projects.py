@@ -1,13 +1,10 @@
 import pytest
-from fastapi.testclient import TestClient
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from datetime import datetime
 
-from main import app
 from backend.models import Project
 
-client = TestClient(app)
-
 def test_create_project(client, db, analyst_token):
     """Test creating a new project."""
     response = client.post(
@@ -26,7 +23,7 @@ def test_create_project(client, db, analyst_token):
     assert data["status"] == "active"
     
     # Verify project was created
-    project = db.query(Project).filter(Project.name == "Test Project").first()
+    project = db.query(Project.description, Project.status).filter(Project.name == "Test Project").first()
     assert project is not None
     assert project.description == "A test project"
     assert project.status == "active"
@@ -44,22 +41,23 @@ def test_create_project_invalid_status(client, db, analyst_token):
     )
     assert response.status_code == 422
 
-def test_list_projects(client, db, analyst_token):
+def test_list_projects(client, db, analyst_user, analyst_token):
     """Test listing projects."""
-    # Create test projects
-    project1 = Project(
-        name="Project 1",
-        description="First project",
-        status="active",
-        owner_id=db.query(User).filter(User.email == "analyst@example.com").first().id
-    )
-    project2 = Project(
-        name="Project 2",
-        description="Second project",
-        status="completed",
-        owner_id=db.query(User).filter(User.email == "analyst@example.com").first().id
-    )
-    db.add_all([project1, project2])
+    # Create test projects in one round-trip
+    db.execute(insert(Project), [
+        {
+            "name": "Project 1",
+            "description": "First project",
+            "status": "active",
+            "owner_id": analyst_user.id
+        },
+        {
+            "name": "Project 2",
+            "description": "Second project",
+            "status": "completed",
+            "owner_id": analyst_user.id
+        }
+    ])
     db.commit()
     
     response = client.get(
@@ -73,14 +71,14 @@ def test_list_projects(client, db, analyst_token):
     assert "Project 1" in project_names
     assert "Project 2" in project_names
 
-def test_get_project(client, db, analyst_token):
+def test_get_project(client, db, analyst_user, analyst_token):
     """Test getting a specific project."""
     # Create test project
     project = Project(
         name="Test Project",
         description="A test project",
         status="active",
-        owner_id=db.query(User).filter(User.email == "analyst@example.com").first().id
+        owner_id=analyst_user.id
     )
     db.add(project)
     db.commit()
@@ -104,14 +102,14 @@ def test_get_nonexistent_project(client, db, analyst_token):
     assert response.status_code == 404
     assert response.json()["detail"] == "Project not found"
 
-def test_update_project(client, db, analyst_token):
+def test_update_project(client, db, analyst_user, analyst_token):
     """Test updating a project."""
     # Create test project
     project = Project(
         name="Test Project",
         description="A test project",
         status="active",
-        owner_id=db.query(User).filter(User.email == "analyst@example.com").first().id
+        owner_id=analyst_user.id
     )
     db.add(project)
     db.commit()
@@ -132,7 +130,9 @@ def test_update_project(client, db, analyst_token):
     assert data["status"] == "completed"
     
     # Verify project was updated
-    updated_project = db.query(Project).filter(Project.id == project.id).first()
+    updated_project = db.query(
+        Project.name, Project.description, Project.status
+    ).filter(Project.id == project.id).one()
     assert updated_project.name == "Updated Project"
     assert updated_project.description == "Updated description"
     assert updated_project.status == "completed"
@@ -159,14 +159,14 @@ def test_update_project_unauthorized(client, db, analyst_token, admin_user):
     assert response.status_code == 403
     assert response.json()["detail"] == "Not enough permissions"
 
-def test_delete_project(client, db, analyst_token):
+def test_delete_project(client, db, analyst_user, analyst_token):
     """Test deleting a project."""
     # Create test project
     project = Project(
         name="Test Project",
         description="A test project",
         status="active",
-        owner_id=db.query(User).filter(User.email == "analyst@example.com").first().id
+        owner_id=analyst_user.id
     )
     db.add(project)
     db.commit()
@@ -178,7 +178,7 @@ def test_delete_project(client, db, analyst_token):
     assert response.status_code == 204
     
     # Verify project was deleted
-    deleted_project = db.query(Project).filter(Project.id == project.id).first()
+    deleted_project = db.query(Project.id).filter(Project.id == project.id).first()
     assert deleted_project is None
 
 def test_delete_project_unauthorized(client, db, analyst_token, admin_user):
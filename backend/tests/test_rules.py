@@ -34,26 +34,43 @@ def mock_get_current_user():
 
 app.dependency_overrides[get_current_user] = mock_get_current_user
 
-@pytest.fixture
-def client():
-    # Create test database tables
+@pytest.fixture(scope="session")
+def _schema():
+    # Create test database tables once for the session
     Base.metadata.create_all(bind=engine)
-    
+    yield
+    Base.metadata.drop_all(bind=engine)
+
+@pytest.fixture(scope="session")
+def client(_schema):
     # Create test client
     with TestClient(app) as test_client:
         yield test_client
-    
-    # Clean up
-    Base.metadata.drop_all(bind=engine)
 
 @pytest.fixture
-def db_session():
-    # Create test database session
-    session = Session(engine)
+def db_session(_schema):
+    # Run each test in a transaction that is rolled back afterwards; the API
+    # shares the session, so writes made through requests are undone too
+    connection = engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
+    app.dependency_overrides[get_db] = lambda: session
     try:
         yield session
     finally:
+        app.dependency_overrides.pop(get_db, None)
         session.close()
+        transaction.rollback()
+        connection.close()
+
+@pytest.fixture
+def seeded_rule(db_session):
+    # Flushing is enough: the API reads through the same session, and the
+    # rule goes away with the test's transaction
+    rule = Rule(**TEST_RULE, id="test-id", created_by="test_user", updated_by="test_user")
+    db_session.add(rule)
+    db_session.flush()
+    return rule
 
 def test_create_rule(client, db_session):
     """Test creating a new rule."""
@@ -72,26 +89,16 @@ def test_create_invalid_rule(client):
     response = client.post("/api/rules/", json=invalid_rule)
     assert response.status_code == 400
 
-def test_list_rules(client, db_session):
+def test_list_rules(client, seeded_rule):
     """Test listing rules."""
-    # Create a test rule
-    rule = Rule(**TEST_RULE, id="test-id", created_by="test_user", updated_by="test_user")
-    db_session.add(rule)
-    db_session.commit()
-
     response = client.get("/api/rules/")
     assert response.status_code == 200
     data = response.json()
     assert len(data) == 1
     assert data[0]["name"] == TEST_RULE["name"]
 
-def test_get_rule(client, db_session):
+def test_get_rule(client, seeded_rule):
     """Test getting a specific rule."""
-    # Create a test rule
-    rule = Rule(**TEST_RULE, id="test-id", created_by="test_user", updated_by="test_user")
-    db_session.add(rule)
-    db_session.commit()
-
     response = client.get("/api/rules/test-id")
     assert response.status_code == 200
     data = response.json()
@@ -102,13 +109,8 @@ def test_get_nonexistent_rule(client):
     response = client.get("/api/rules/nonexistent")
     assert response.status_code == 404
 
-def test_update_rule(client, db_session):
+def test_update_rule(client, seeded_rule):
     """Test updating a rule."""
-    # Create a test rule
-    rule = Rule(**TEST_RULE, id="test-id", created_by="test_user", updated_by="test_user")
-    db_session.add(rule)
-    db_session.commit()
-
     # Update the rule
     updated_rule = TEST_RULE.copy()
     updated_rule["name"] = "Updated Rule"
@@ -117,13 +119,8 @@ def test_update_rule(client, db_session):
     data = response.json()
     assert data["name"] == "Updated Rule"
 
-def test_delete_rule(client, db_session):
+def test_delete_rule(client, seeded_rule):
     """Test deleting a rule."""
-    # Create a test rule
-    rule = Rule(**TEST_RULE, id="test-id", created_by="test_user", updated_by="test_user")
-    db_session.add(rule)
-    db_session.commit()
-
     response = client.delete("/api/rules/test-id")
     assert response.status_code == 200
 
@@ -131,25 +128,15 @@ def test_delete_rule(client, db_session):
     response = client.get("/api/rules/test-id")
     assert response.status_code == 404
 
-def test_validate_rule(client, db_session):
+def test_validate_rule(client, seeded_rule):
     """Test validating a rule."""
-    # Create a test rule
-    rule = Rule(**TEST_RULE, id="test-id", created_by="test_user", updated_by="test_user")
-    db_session.add(rule)
-    db_session.commit()
-
     response = client.post("/api/rules/test-id/validate")
     assert response.status_code == 200
     data = response.json()
     assert data["is_valid"] is True
 
-def test_test_rule(client, db_session):
+def test_test_rule(client, seeded_rule):
     """Test testing a rule against sample data."""
-    # Create a test rule
-    rule = Rule(**TEST_RULE, id="test-id", created_by="test_user", updated_by="test_user")
-    db_session.add(rule)
-    db_session.commit()
-
     response = client.post("/api/rules/test-id/test?sample_size=50")
     assert response.status_code == 200
     data = response.json()
@@ -157,25 +144,15 @@ def test_test_rule(client, db_session):
     assert "matches" in data
     assert "total_rows" in data
 
-def test_list_rule_versions(client, db_session):
+def test_list_rule_versions(client, seeded_rule):
     """Test listing rule versions."""
-    # Create a test rule
-    rule = Rule(**TEST_RULE, id="test-id", created_by="test_user", updated_by="test_user")
-    db_session.add(rule)
-    db_session.commit()
-
     response = client.get("/api/rules/test-id/versions")
     assert response.status_code == 200
     data = response.json()
     assert len(data) == 1  # Initial version
 
-def test_compare_versions(client, db_session):
+def test_compare_versions(client, seeded_rule):
     """Test comparing rule versions."""
-    # Create a test rule
-    rule = Rule(**TEST_RULE, id="test-id", created_by="test_user", updated_by="test_user")
-    db_session.add(rule)
-    db_session.commit()
-
     # Update the rule to create a new version
     updated_rule = TEST_RULE.copy()
     updated_rule["name"] = "Updated Rule"
@@ -187,13 +164,8 @@ def test_compare_versions(client, db_session):
     assert "changes" in data
     assert len(data["changes"]["modified"]) > 0
 
-def test_rollback_rule(client, db_session):
+def test_rollback_rule(client, seeded_rule):
     """Test rolling back a rule to a previous version."""
-    # Create a test rule
-    rule = Rule(**TEST_RULE, id="test-id", created_by="test_user", updated_by="test_user")
-    db_session.add(rule)
-    db_session.commit()
-
     # Update the rule
     updated_rule = TEST_RULE.copy()
     updated_rule["name"] = "Updated Rule"
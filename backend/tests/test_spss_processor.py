@@ -1,20 +1,17 @@
 import pytest
 import pandas as pd
 import numpy as np
-from datetime import datetime
 from services.spss_processor import SPSSProcessor
-import tempfile
-import os
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_data():
-    """Create sample data for testing."""
+    """Create sample data for testing; the tests only read it."""
     data = {
         'email': ['test@example.com', 'invalid-email', 'user@domain.com'],
         'ip_address': ['192.168.1.1', 'invalid-ip', '10.0.0.1'],
         'date': ['2024-01-01', 'invalid-date', '2024-02-01'],
-        'numeric': [1, 2, 3, 4, 5, 1000],  # Includes outlier
-        'text': ['a', 'b', 'c', None, 'd']
+        'numeric': [1, 2, 1000],  # Includes outlier
+        'text': ['a', None, 'b']
     }
     return pd.DataFrame(data)
 
@@ -25,20 +22,26 @@ def spss_processor():
 
 def test_detect_data_type(spss_processor, sample_data):
     """Test data type detection."""
+    # Every value must match a pattern, so only the valid rows are used
+    valid = [0, 2]
+    
     # Test email detection
-    assert spss_processor._detect_data_type(sample_data['email']) == 'email'
+    assert spss_processor._detect_data_type(sample_data['email'].iloc[valid]) == 'email'
     
     # Test IP address detection
-    assert spss_processor._detect_data_type(sample_data['ip_address']) == 'ip_address'
+    assert spss_processor._detect_data_type(sample_data['ip_address'].iloc[valid]) == 'ip_address'
     
     # Test date detection
-    assert spss_processor._detect_data_type(sample_data['date']) == 'date'
+    assert spss_processor._detect_data_type(sample_data['date'].iloc[valid]) == 'date'
     
     # Test numeric detection
     assert spss_processor._detect_data_type(sample_data['numeric']) == 'numeric'
     
     # Test text detection
     assert spss_processor._detect_data_type(sample_data['text']) == 'text'
+    
+    # One invalid value makes a column plain text
+    assert spss_processor._detect_data_type(sample_data['email']) == 'text'
 
 def test_validate_emails(spss_processor, sample_data):
     """Test email validation."""
@@ -47,6 +50,10 @@ def test_validate_emails(spss_processor, sample_data):
     assert validation['valid_count'] == 2
     assert validation['invalid_count'] == 1
     assert 'invalid-email' in validation['invalid_values']
+    
+    # Missing values are not email addresses
+    validation = spss_processor._validate_emails(pd.Series(['a@b.org', None], dtype=object))
+    assert validation['invalid_count'] == 1
 
 def test_validate_ip_addresses(spss_processor, sample_data):
     """Test IP address validation."""
@@ -56,6 +63,15 @@ def test_validate_ip_addresses(spss_processor, sample_data):
     assert validation['invalid_count'] == 1
     assert 'invalid-ip' in validation['invalid_values']
 
+def test_validate_ip_addresses_beyond_dotted_quads(spss_processor):
+    """Test that IPv6 addresses are valid and out-of-range octets are not."""
+    column = pd.Series(['::1', '2001:db8::1', '256.1.1.1', '01.2.3.4', None], dtype=object)
+    validation = spss_processor._validate_ip_addresses(column)
+    
+    assert validation['invalid_values'] == ['256.1.1.1', '01.2.3.4']
+    assert validation['invalid_count'] == 2
+    assert validation['valid_count'] == 3
+
 def test_validate_dates(spss_processor, sample_data):
     """Test date validation."""
     validation = spss_processor._validate_dates(sample_data['date'])
@@ -64,6 +80,14 @@ def test_validate_dates(spss_processor, sample_data):
     assert validation['invalid_count'] == 1
     assert 'invalid-date' in validation['invalid_values']
 
+def test_validate_dates_calendar(spss_processor):
+    """Test that impossible dates are invalid and very old dates are valid."""
+    column = pd.Series(['2024-02-29', '2023-02-29', '0001-01-01', None], dtype=object)
+    validation = spss_processor._validate_dates(column)
+    
+    assert validation['invalid_values'] == ['2023-02-29']
+    assert validation['valid_count'] == 3
+
 def test_analyze_distribution(spss_processor, sample_data):
     """Test distribution analysis."""
     # Test numeric distribution
@@ -79,6 +103,22 @@ def test_analyze_distribution(spss_processor, sample_data):
     assert 'unique_values' in text_dist
     assert 'most_common' in text_dist
     assert 'least_common' in text_dist
+    assert text_dist['unique_values'] == 2
+
+def test_describe_numeric_matches_pandas(spss_processor):
+    """Test the compiled numeric summary against pandas' describe()."""
+    column = pd.Series([3.5, np.nan, -2.0, 10.0, 1e9, 7.25])
+    summary = spss_processor._describe_numeric(column)
+    expected = column.describe()
+    
+    for key in ('mean', 'std', 'min', '25%', '50%', '75%', 'max'):
+        assert summary[key] == pytest.approx(expected[key])
+    
+    # Booleans count as 0/1; a single value has no sample deviation
+    assert spss_processor._describe_numeric(pd.Series([True, False, True]))['mean'] == pytest.approx(2 / 3)
+    assert np.isnan(spss_processor._describe_numeric(pd.Series([4.0]))['std'])
+    assert all(np.isnan(value) for value in
+               spss_processor._describe_numeric(pd.Series([np.nan, np.nan])).values())
 
 def test_calculate_completeness(spss_processor, sample_data):
     """Test completeness calculation."""
@@ -93,12 +133,24 @@ def test_calculate_consistency(spss_processor, sample_data):
     """Test consistency calculation."""
     spss_processor.data = sample_data
     spss_processor.schema = {
+        'email': {'type': 'text'},
+        'ip_address': {'type': 'text'},
+        'date': {'type': 'date'},
         'numeric': {'type': 'numeric'},
-        'date': {'type': 'date'}
+        'text': {'type': 'text'}
     }
     
     consistency = spss_processor._calculate_consistency()
     assert 0 <= consistency <= 1
+    
+    # One IQR outlier in five rows
+    spss_processor.data = pd.DataFrame({'numeric': [1, 2, 3, 4, 100]})
+    spss_processor.schema = {'numeric': {'type': 'numeric'}}
+    assert spss_processor._calculate_consistency() == pytest.approx(0.8)
+    
+    # An empty frame has nothing inconsistent, rather than a NaN score
+    spss_processor.data = pd.DataFrame({'numeric': pd.Series([], dtype=float)})
+    assert spss_processor._calculate_consistency() == 1.0
 
 def test_calculate_validity(spss_processor, sample_data):
     """Test validity calculation."""
@@ -106,11 +158,14 @@ def test_calculate_validity(spss_processor, sample_data):
     spss_processor.schema = {
         'email': {'type': 'email', 'validation': {'invalid_count': 1}},
         'ip_address': {'type': 'ip_address', 'validation': {'invalid_count': 1}},
-        'date': {'type': 'date', 'validation': {'invalid_count': 1}}
+        'date': {'type': 'date', 'validation': {'invalid_count': 1}},
+        'numeric': {'type': 'numeric'},
+        'text': {'type': 'text'}
     }
     
     validity = spss_processor._calculate_validity()
-    assert 0 <= validity <= 1
+    # One invalid value in three rows for each validated column
+    assert validity == pytest.approx(2 / 3)
 
 def test_analyze_data_quality(spss_processor, sample_data):
     """Test overall data quality analysis."""
@@ -147,6 +202,42 @@ def test_detect_schema(spss_processor, sample_data):
         assert 'null_count' in schema[column]
         assert 'unique_count' in schema[column]
         assert 'distribution' in schema[column]
+    
+    assert schema['numeric']['type'] == 'numeric'
+    assert schema['numeric']['distribution']['max'] == 1000
+    assert schema['text']['null_count'] == 1
+
+def test_detect_schema_validations(spss_processor):
+    """Test the validations attached to detected email, IP and date columns."""
+    spss_processor.data = pd.DataFrame({
+        'email': ['a@example.com', 'b@example.org', 'c@example.net'],
+        'ip_address': ['10.0.0.1', '999.0.0.1', '192.168.1.1'],
+        'date': ['2024-01-31', '2024-02-30', '2024-03-01']
+    })
+    schema = spss_processor.detect_schema()
+    
+    assert schema['email']['type'] == 'email'
+    assert schema['email']['validation'] == {
+        'valid_count': 3, 'invalid_count': 0, 'invalid_values': []
+    }
+    assert schema['ip_address']['type'] == 'ip_address'
+    assert schema['ip_address']['validation']['invalid_values'] == ['999.0.0.1']
+    assert schema['date']['type'] == 'date'
+    assert schema['date']['validation']['invalid_values'] == ['2024-02-30']
+
+def test_schema_key_covers_whole_frame(spss_processor):
+    """Test that a change anywhere in the frame changes the schema cache key."""
+    data = pd.DataFrame({'numeric': np.arange(10_000), 'text': ['a'] * 10_000})
+    spss_processor.data = data
+    key = spss_processor._schema_key()
+    
+    spss_processor.data = data.copy()
+    assert spss_processor._schema_key() == key
+    
+    changed = data.copy()
+    changed.loc[5_000, 'text'] = None
+    spss_processor.data = changed
+    assert spss_processor._schema_key() != key
 
 def test_analyze_structure_without_data(spss_processor):
     """Test structure analysis without loaded data."""
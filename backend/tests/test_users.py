@@ -1,13 +1,13 @@
 import pytest
-from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
-from datetime import datetime
+from uuid import UUID
 
-from main import app
 from backend.models import User
 from backend.security import get_password_hash, create_access_token
 
-client = TestClient(app)
+# bcrypt is deliberately slow; hash the test passwords once per module
+_ADMIN_PW_HASH = get_password_hash("adminpassword")
+_ANALYST_PW_HASH = get_password_hash("analystpassword")
 
 @pytest.fixture
 def admin_user(db: Session):
@@ -15,7 +15,7 @@ def admin_user(db: Session):
     user = User(
         email="admin@example.com",
         name="Admin User",
-        password=get_password_hash("adminpassword"),
+        password=_ADMIN_PW_HASH,
         role="admin"
     )
     db.add(user)
@@ -29,7 +29,7 @@ def analyst_user(db: Session):
     user = User(
         email="analyst@example.com",
         name="Analyst User",
-        password=get_password_hash("analystpassword"),
+        password=_ANALYST_PW_HASH,
         role="analyst"
     )
     db.add(user)
@@ -66,7 +66,7 @@ def test_create_user_as_admin(client, db, admin_token):
     assert data["role"] == "analyst"
     
     # Verify user was created
-    user = db.query(User).filter(User.email == "new@example.com").first()
+    user = db.get(User, UUID(data["id"]))
     assert user is not None
     assert user.name == "New User"
     assert user.role == "analyst"
@@ -112,13 +112,13 @@ def test_update_current_user(client, db, analyst_token, analyst_user):
     assert data["name"] == "Updated Name"
     
     # Verify user was updated
-    user = db.query(User).filter(User.id == analyst_user.id).first()
+    user = db.get(User, analyst_user.id)
     assert user.name == "Updated Name"
 
 def test_list_users_as_admin(client, db, admin_token, admin_user, analyst_user):
     """Test listing users as admin."""
     response = client.get(
-        "/users/",
+        "/users/?limit=10",
         headers={"Authorization": f"Bearer {admin_token}"}
     )
     assert response.status_code == 200
@@ -174,7 +174,7 @@ def test_update_user_as_admin(client, db, admin_token, analyst_user):
     assert data["role"] == "senior_analyst"
     
     # Verify user was updated
-    user = db.query(User).filter(User.id == analyst_user.id).first()
+    user = db.get(User, analyst_user.id)
     assert user.name == "Updated by Admin"
     assert user.role == "senior_analyst"
 